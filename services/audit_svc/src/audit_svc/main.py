@@ -19,6 +19,7 @@ from .models import (
     AuditRun,
     CreateRunRequest,
     CreateRunResponse,
+    LogAuditBatchRequest,
     LogAuditRequest,
     OperationType,
 )
@@ -126,6 +127,53 @@ def _save_run(run: AuditRun) -> None:
     logger.info(f"Saved audit run {run.run_id}")
 
 
+def _append_entry(run: AuditRun, request: LogAuditRequest) -> str:
+    """Append an audit entry to a run and update its counters.
+
+    Args:
+        run: Run to add the entry to
+        request: Audit entry data
+
+    Returns:
+        ID of the new entry
+    """
+    # Create entry
+    entry_id = _generate_entry_id()
+
+    # Redact prompt if not already redacted
+    prompt_redacted = request.prompt_redacted
+    if prompt_redacted and not any(marker in prompt_redacted for marker in ['[EMAIL]', '[PHONE]', '[API_KEY]']):
+        prompt_redacted = _redact_pii(prompt_redacted)
+
+    entry = AuditEntry(
+        entry_id=entry_id,
+        run_id=request.run_id,
+        operation=request.operation,
+        timestamp_start=request.timestamp_start,
+        timestamp_end=request.timestamp_end or datetime.now().isoformat(),
+        prompt_redacted=prompt_redacted,
+        tool_calls=request.tool_calls,
+        artifacts=request.artifacts,
+        status=request.status,
+        error_message=request.error_message,
+        metadata=request.metadata,
+    )
+
+    # Add entry to run
+    run.entries.append(entry)
+    run.total_operations = len(run.entries)
+
+    # Update success/failure counts
+    run.successful_operations = sum(1 for e in run.entries if e.status == "SUCCESS")
+    run.failed_operations = sum(1 for e in run.entries if e.status == "FAILED")
+
+    # Update completion timestamp if not set
+    if not run.completed_at:
+        run.completed_at = datetime.now().isoformat()
+
+    return entry_id
+
+
 @app.get("/healthz")
 async def healthz() -> dict[str, str]:
     """Return service health status."""
@@ -175,45 +223,40 @@ async def log_audit_entry(request: LogAuditRequest) -> dict[str, str]:
     # Load existing run
     run = _load_run(request.run_id)
 
-    # Create entry
-    entry_id = _generate_entry_id()
+    entry_id = _append_entry(run, request)
 
-    # Redact prompt if not already redacted
-    prompt_redacted = request.prompt_redacted
-    if prompt_redacted and not any(marker in prompt_redacted for marker in ['[EMAIL]', '[PHONE]', '[API_KEY]']):
-        prompt_redacted = _redact_pii(prompt_redacted)
+    _save_run(run)
 
-    entry = AuditEntry(
-        entry_id=entry_id,
-        run_id=request.run_id,
-        operation=request.operation,
-        timestamp_start=request.timestamp_start,
-        timestamp_end=request.timestamp_end or datetime.now().isoformat(),
-        prompt_redacted=prompt_redacted,
-        tool_calls=request.tool_calls,
-        artifacts=request.artifacts,
-        status=request.status,
-        error_message=request.error_message,
-        metadata=request.metadata,
-    )
+    logger.info(f"Logged {request.operation} entry {entry_id} to run {request.run_id}")
 
-    # Add entry to run
-    run.entries.append(entry)
-    run.total_operations = len(run.entries)
+    return {"status": "logged", "entry_id": entry_id, "run_id": request.run_id}
 
-    # Update success/failure counts
-    run.successful_operations = sum(1 for e in run.entries if e.status == "SUCCESS")
-    run.failed_operations = sum(1 for e in run.entries if e.status == "FAILED")
 
-    # Update completion timestamp if not set
-    if not run.completed_at:
-        run.completed_at = datetime.now().isoformat()
+@app.post("/audit/log/batch")
+async def log_audit_entries(request: LogAuditBatchRequest) -> dict:
+    """Log several audit entries, loading and saving each run only once.
 
-    _save_run(run)
+    Args:
+        request: Audit entries, possibly spanning several runs
 
-    logger.info(f"Logged {request.operation} entry {entry_id} to run {request.run_id}")
+    Returns:
+        Success message with entry IDs in request order
+    """
+    runs: dict[str, AuditRun] = {}
+    entry_ids = []
 
-    return {"status": "logged", "entry_id": entry_id, "run_id": request.run_id}
+    for entry_request in request.entries:
+        run = runs.get(entry_request.run_id)
+        if run is None:
+            run = runs[entry_request.run_id] = _load_run(entry_request.run_id)
+        entry_ids.append(_append_entry(run, entry_request))
+
+    for run in runs.values():
+        _save_run(run)
+
+    logger.info(f"Logged {len(entry_ids)} entries to {len(runs)} runs")
+
+    return {"status": "logged", "entry_ids": entry_ids}
 
 
 @app.get("/audit/{run_id}", response_model=AuditRun)
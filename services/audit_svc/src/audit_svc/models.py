@@ -84,6 +84,12 @@ class LogAuditRequest(BaseModel):
     metadata: dict = Field(default_factory=dict, description="Additional metadata")
 
 
+class LogAuditBatchRequest(BaseModel):
+    """Request to log several audit entries at once."""
+
+    entries: list[LogAuditRequest] = Field(..., description="Audit entries to log")
+
+
 class CreateRunRequest(BaseModel):
     """Request to create a new audit run."""
 
@@ -254,6 +254,8 @@ async def tailor_cv(request: TailorRequest) -> TailorResponse:
         cv_html=cv_html,
         pdf_path=pdf_path,
         diff_summary=diff_summary,
+        timestamp=timestamp,
+        job_folder=job_folder,
     )
 
 
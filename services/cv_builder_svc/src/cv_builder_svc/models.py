@@ -28,6 +28,10 @@ class TailorResponse(BaseModel):
     cv_html: str = Field(..., description="Tailored CV in HTML format")
     pdf_path: str = Field(..., description="Path to generated PDF")
     diff_summary: CVDiffSummary = Field(..., description="Summary of changes from base CV")
+    timestamp: str = Field(
+        default="", description="Timestamp used in the artifact file names"
+    )
+    job_folder: str = Field(default="", description="Job folder name under jobs/")
 
 
 class ValidationViolation(BaseModel):
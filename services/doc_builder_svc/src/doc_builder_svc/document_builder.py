@@ -158,7 +158,7 @@ class CoverLetterBuilder(DocumentBuilder):
 
     def generate_cover_letter(
         self, profile: dict[str, Any], job: dict[str, Any], tone: str = "concise, impact-focused"
-    ) -> tuple[str, str]:
+    ) -> tuple[str, str, bool]:
         """Generate cover letter in Markdown and HTML.
 
         Args:
@@ -167,13 +167,16 @@ class CoverLetterBuilder(DocumentBuilder):
             tone: Tone for the cover letter
 
         Returns:
-            Tuple of (cover_letter_markdown, cover_letter_html)
+            Tuple of (cover_letter_markdown, cover_letter_html, used_fallback),
+            where used_fallback is True when the basic template replaced LLM output
         """
         prompt = self._build_cover_letter_prompt(profile, job, tone)
 
+        used_fallback = True
         try:
             if self.llm_provider.lower() == "openai":
                 cover_letter_md = self._call_openai(prompt)
+                used_fallback = False
             else:
                 logger.warning(
                     f"Unsupported LLM provider: {self.llm_provider}, using basic template"
@@ -186,7 +189,7 @@ class CoverLetterBuilder(DocumentBuilder):
         # Convert to HTML with evidence
         cover_letter_html = self._markdown_to_html_with_evidence(cover_letter_md, profile)
 
-        return cover_letter_md, cover_letter_html
+        return cover_letter_md, cover_letter_html, used_fallback
 
     def _build_cover_letter_prompt(
         self, profile: dict[str, Any], job: dict[str, Any], tone: str
@@ -282,7 +285,7 @@ class SupplementalBuilder(DocumentBuilder):
         profile: dict[str, Any],
         job: dict[str, Any],
         questions: list[dict[str, Any]],
-    ) -> tuple[str, str]:
+    ) -> tuple[str, str, bool]:
         """Generate supplemental answers in Markdown and HTML.
 
         Args:
@@ -291,13 +294,16 @@ class SupplementalBuilder(DocumentBuilder):
             questions: List of questions to answer
 
         Returns:
-            Tuple of (supplemental_markdown, supplemental_html)
+            Tuple of (supplemental_markdown, supplemental_html, used_fallback),
+            where used_fallback is True when the basic template replaced LLM output
         """
         prompt = self._build_supplemental_prompt(profile, job, questions)
 
+        used_fallback = True
         try:
             if self.llm_provider.lower() == "openai":
                 supplemental_md = self._call_openai(prompt)
+                used_fallback = False
             else:
                 logger.warning(
                     f"Unsupported LLM provider: {self.llm_provider}, using basic template"
@@ -310,7 +316,7 @@ class SupplementalBuilder(DocumentBuilder):
         # Convert to HTML with evidence
         supplemental_html = self._markdown_to_html_with_evidence(supplemental_md, profile)
 
-        return supplemental_md, supplemental_html
+        return supplemental_md, supplemental_html, used_fallback
 
     def _build_supplemental_prompt(
         self, profile: dict[str, Any], job: dict[str, Any], questions: list[dict[str, Any]]
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
 import shutil
+import sys
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
+import aiofiles.os
 import httpx
+import orjson
 from fastapi import FastAPI, HTTPException
 
 from .document_builder import CoverLetterBuilder, SupplementalBuilder
 from .models import (
     CoverLetterRequest,
     CoverLetterResponse,
+    DocsBundleRequest,
+    DocsBundleResponse,
     SupplementalRequest,
     SupplementalResponse,
     ValidateRequest,
@@ -21,6 +32,18 @@ from .models import (
     ValidationViolation,
 )
 
+try:
+    from guardrails import validate_artifacts
+    from mcp_clients import DirectFsClient, StdIOClient
+except ImportError:
+    # Fallback for running from a source checkout: add the shared libs to
+    # sys.path once at import time rather than inside request handlers.
+    _libs_root = Path(__file__).resolve().parents[4] / "libs"
+    sys.path.insert(0, str(_libs_root / "mcp_clients" / "src"))
+    sys.path.insert(0, str(_libs_root / "guardrails" / "src"))
+    from guardrails import validate_artifacts
+    from mcp_clients import DirectFsClient, StdIOClient
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -30,6 +53,13 @@ app = FastAPI(title="Doc Builder Service")
 cover_letter_builder = CoverLetterBuilder()
 supplemental_builder = SupplementalBuilder()
 
+# In-flight storage lookups, shared by concurrent requests for the same key
+_inflight: dict[tuple[str, str], asyncio.Future[Any]] = {}
+
+# Generated (markdown, html) pairs keyed on a digest of the generation inputs
+_GENERATION_CACHE_SIZE = 256
+_generation_cache: OrderedDict[str, tuple[str, str]] = OrderedDict()
+
 
 def _storage_service_url() -> str:
     """Get storage service URL from environment."""
@@ -38,8 +68,72 @@ def _storage_service_url() -> str:
     return f"http://{host}:{port}"
 
 
+async def _single_flight(
+    key: tuple[str, str], load: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Run ``load`` once for concurrent callers sharing the same key.
+
+    The first caller performs the lookup; callers arriving while it is in
+    flight await the same result (or exception) instead of repeating it.
+    """
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await load()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved when nobody else is waiting
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+def _generation_key(*inputs: Any) -> str:
+    """Stable digest of the inputs that determine a generated document."""
+    payload = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _generate_cached(
+    key: str, generate: Callable[[], tuple[str, str, bool]]
+) -> tuple[str, str]:
+    """Return the cached document for ``key``, generating it on a miss.
+
+    Template fallbacks (LLM failure or unsupported provider) are returned but
+    not cached, so a retry with the same inputs calls the LLM again.
+    """
+    cached = _generation_cache.get(key)
+    if cached is not None:
+        _generation_cache.move_to_end(key)
+        return cached
+
+    markdown, html, used_fallback = generate()
+    result = (markdown, html)
+    if used_fallback:
+        return result
+    _generation_cache[key] = result
+    if len(_generation_cache) > _GENERATION_CACHE_SIZE:
+        _generation_cache.popitem(last=False)
+    return result
+
+
 async def _load_profile() -> dict:
     """Load canonical profile from storage."""
+    return await _single_flight(("profile", ""), _fetch_profile)
+
+
+async def _fetch_profile() -> dict:
+    """Fetch canonical profile from the storage service."""
     storage_url = _storage_service_url()
     async with httpx.AsyncClient(timeout=30.0) as client:
         response = await client.get(f"{storage_url}/profile")
@@ -50,19 +144,11 @@ async def _load_profile() -> dict:
 
 async def _load_job(job_id: str) -> dict:
     """Load job data from storage."""
-    import json
-    import sys
+    return await _single_flight(("job", job_id), lambda: _fetch_job(job_id))
 
-    # Use MCP client to read job.json
-    try:
-        from mcp_clients import DirectFsClient
-    except ImportError:
-        # Fallback: Add mcp_clients to path
-        repo_root = Path(__file__).resolve().parents[4]
-        mcp_clients_path = repo_root / "libs" / "mcp_clients" / "src"
-        sys.path.insert(0, str(mcp_clients_path))
-        from mcp_clients import DirectFsClient
 
+async def _fetch_job(job_id: str) -> dict:
+    """Fetch job.json for a job from storage."""
     # Find job folder
     storage_url = _storage_service_url()
     async with httpx.AsyncClient(timeout=30.0) as client:
@@ -101,6 +187,11 @@ async def _load_job(job_id: str) -> dict:
 
 async def _find_job_folder(job_id: str) -> str:
     """Find job folder name for a given job_id."""
+    return await _single_flight(("folder", job_id), lambda: _lookup_job_folder(job_id))
+
+
+async def _lookup_job_folder(job_id: str) -> str:
+    """List the jobs directory and match the folder for a job_id."""
     storage_url = _storage_service_url()
     async with httpx.AsyncClient(timeout=30.0) as client:
         response = await client.get(f"{storage_url}/list?path=jobs")
@@ -162,18 +253,6 @@ async def _render_pdf(html_content: str, job_folder: str, filename: str) -> str:
     Returns:
         Path to generated PDF
     """
-    import sys
-
-    # Use MCP client to call pdf.render
-    try:
-        from mcp_clients import StdIOClient
-    except ImportError:
-        # Fallback: Add mcp_clients to path
-        repo_root = Path(__file__).resolve().parents[4]
-        mcp_clients_path = repo_root / "libs" / "mcp_clients" / "src"
-        sys.path.insert(0, str(mcp_clients_path))
-        from mcp_clients import StdIOClient
-
     # Call MCP PDF service
     client = StdIOClient("mcp_pdf")
     result = await client.call_tool("pdf.render", {"markup": html_content, "template": "simple"})
@@ -189,13 +268,18 @@ async def _render_pdf(html_content: str, job_folder: str, filename: str) -> str:
     if not pdf_path:
         raise RuntimeError("PDF rendering failed - no path returned")
 
-    # Move PDF to job folder
+    # Move PDF to job folder. The MCP PDF exports live under the same
+    # JobSearch root, so this is normally a single rename(2); fall back to
+    # copy+delete in a worker thread when they sit on different mounts.
     jobsearch_home = Path(os.getenv("JOBSEARCH_HOME", str(Path.home() / "JobSearch")))
     job_folder_path = jobsearch_home / "jobs" / job_folder
-    job_folder_path.mkdir(parents=True, exist_ok=True)
+    await aiofiles.os.makedirs(job_folder_path, exist_ok=True)
 
     target_pdf_path = job_folder_path / filename
-    shutil.move(pdf_path, target_pdf_path)
+    try:
+        await aiofiles.os.rename(pdf_path, target_pdf_path)
+    except OSError:
+        await asyncio.to_thread(shutil.move, pdf_path, target_pdf_path)
 
     logger.info(f"Moved PDF to {target_pdf_path}")
     return str(target_pdf_path)
@@ -228,8 +312,9 @@ async def create_cover_letter(request: CoverLetterRequest) -> CoverLetterRespons
     logger.info(f"Loaded profile and job data for {job['title']} at {job['company']}")
 
     # Generate cover letter
-    cover_letter_md, cover_letter_html = cover_letter_builder.generate_cover_letter(
-        profile, job, tone
+    cover_letter_md, cover_letter_html = _generate_cached(
+        _generation_key("cover", profile, job, tone),
+        lambda: cover_letter_builder.generate_cover_letter(profile, job, tone),
     )
 
     logger.info("Generated cover letter")
@@ -265,6 +350,8 @@ async def create_cover_letter(request: CoverLetterRequest) -> CoverLetterRespons
         cover_letter_html=cover_letter_html,
         pdf_path=pdf_path,
         tone=tone,
+        timestamp=timestamp,
+        job_folder=job_folder,
     )
 
 
@@ -289,11 +376,16 @@ async def create_supplementals(request: SupplementalRequest) -> SupplementalResp
     logger.info(f"Loaded profile and job data for {job['title']} at {job['company']}")
 
     # Convert questions to dict format
-    questions_dict = [q.model_dump() for q in questions]
+    questions_dict = [
+        {"question": q.question, "max_words": q.max_words} for q in questions
+    ]
 
     # Generate supplemental document
-    supplemental_md, supplemental_html = supplemental_builder.generate_supplemental(
-        profile, job, questions_dict
+    supplemental_md, supplemental_html = _generate_cached(
+        _generation_key("supplemental", profile, job, questions_dict),
+        lambda: supplemental_builder.generate_supplemental(
+            profile, job, questions_dict
+        ),
     )
 
     logger.info("Generated supplemental documents")
@@ -329,9 +421,50 @@ async def create_supplementals(request: SupplementalRequest) -> SupplementalResp
         supplemental_html=supplemental_html,
         pdf_path=pdf_path,
         markdown_path=md_path,
+        timestamp=timestamp,
+        job_folder=job_folder,
     )
 
 
+@app.post("/docs/bundle", response_model=DocsBundleResponse)
+async def create_docs_bundle(request: DocsBundleRequest) -> DocsBundleResponse:
+    """Generate the cover letter and supplementals for a job in one call.
+
+    Both documents are generated concurrently. A failure in one part is
+    reported in its error field and does not fail the other.
+
+    Args:
+        request: Job ID and the documents to generate
+
+    Returns:
+        DocsBundleResponse with a response or error per requested document
+    """
+    job_id = request.job_id
+    parts: dict[str, Awaitable[Any]] = {}
+    if request.cover is not None:
+        parts["cover"] = create_cover_letter(
+            CoverLetterRequest(job_id=job_id, tone=request.cover.tone)
+        )
+    if request.supplemental is not None:
+        parts["supplemental"] = create_supplementals(
+            SupplementalRequest(job_id=job_id, questions=request.supplemental.questions)
+        )
+
+    results = await asyncio.gather(*parts.values(), return_exceptions=True)
+
+    response = DocsBundleResponse(job_id=job_id)
+    for name, result in zip(parts, results):
+        if isinstance(result, Exception):
+            detail = result.detail if isinstance(result, HTTPException) else str(result)
+            logger.error(f"Bundle {name} generation failed for job {job_id}: {detail}")
+            setattr(response, f"{name}_error", str(detail))
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            setattr(response, name, result)
+    return response
+
+
 @app.post("/validate", response_model=ValidateResponse)
 async def validate_artifacts_endpoint(request: ValidateRequest) -> ValidateResponse:
     """Validate artifacts against profile guardrails.
@@ -342,17 +475,6 @@ async def validate_artifacts_endpoint(request: ValidateRequest) -> ValidateRespo
     Returns:
         ValidateResponse with pass/fail and violations
     """
-    import sys
-
-    # Add guardrails to path
-    try:
-        from guardrails import validate_artifacts
-    except ImportError:
-        repo_root = Path(__file__).resolve().parents[4]
-        guardrails_path = repo_root / "libs" / "guardrails" / "src"
-        sys.path.insert(0, str(guardrails_path))
-        from guardrails import validate_artifacts
-
     # Get paths
     jobsearch_home = Path(os.getenv("JOBSEARCH_HOME", str(Path.home() / "JobSearch")))
     profile_path = jobsearch_home / "profile" / "canonical_profile.json"
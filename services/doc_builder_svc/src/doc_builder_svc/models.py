@@ -39,6 +39,10 @@ class CoverLetterResponse(BaseModel):
     cover_letter_html: str = Field(..., description="Cover letter in HTML format")
     pdf_path: str = Field(..., description="Path to generated PDF")
     tone: str = Field(..., description="Tone used for the cover letter")
+    timestamp: str = Field(
+        default="", description="Timestamp used in the artifact file names"
+    )
+    job_folder: str = Field(default="", description="Job folder name under jobs/")
 
 
 class SupplementalResponse(BaseModel):
@@ -49,6 +53,56 @@ class SupplementalResponse(BaseModel):
     supplemental_html: str = Field(..., description="Supplemental answers in HTML format")
     pdf_path: str = Field(..., description="Path to generated PDF")
     markdown_path: str = Field(..., description="Path to Markdown file")
+    timestamp: str = Field(
+        default="", description="Timestamp used in the artifact file names"
+    )
+    job_folder: str = Field(default="", description="Job folder name under jobs/")
+
+
+class BundleCoverOptions(BaseModel):
+    """Cover letter part of a document bundle request."""
+
+    tone: str = Field(
+        default="concise, impact-focused", description="Tone for the cover letter"
+    )
+
+
+class BundleSupplementalOptions(BaseModel):
+    """Supplemental part of a document bundle request."""
+
+    questions: list[SupplementalQuestion] = Field(
+        ..., description="List of questions to answer"
+    )
+
+
+class DocsBundleRequest(BaseModel):
+    """Request to generate several documents for one job in a single call."""
+
+    job_id: str = Field(..., description="Job ID to generate documents for")
+    cover: BundleCoverOptions | None = Field(
+        default=None, description="Generate a cover letter"
+    )
+    supplemental: BundleSupplementalOptions | None = Field(
+        default=None, description="Generate supplemental documents"
+    )
+
+
+class DocsBundleResponse(BaseModel):
+    """Response with every document generated for a bundle request."""
+
+    job_id: str = Field(..., description="Job ID")
+    cover: CoverLetterResponse | None = Field(
+        default=None, description="Generated cover letter"
+    )
+    cover_error: str = Field(
+        default="", description="Error if cover letter generation failed"
+    )
+    supplemental: SupplementalResponse | None = Field(
+        default=None, description="Generated supplemental documents"
+    )
+    supplemental_error: str = Field(
+        default="", description="Error if supplemental generation failed"
+    )
 
 
 class ValidationViolation(BaseModel):
@@ -1,18 +1,85 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
+import random
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Iterator
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from .models import JobPosting, SearchFilters
 
 logger = logging.getLogger(__name__)
 
+# Concurrent requests allowed against a single job board host
+_MAX_REQUESTS_PER_HOST = 4
+# Concurrent company fetches across all adapters in search_all
+_MAX_CONCURRENT_FETCHES = 20
+# Upper bound in seconds on any retry delay, including Retry-After
+_MAX_BACKOFF = 8.0
+_host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+_HEADING_TAGS = frozenset({"h2", "h3", "h4"})
+_LOCATION_RE = re.compile(r"location", re.I)
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    """Get the concurrency gate for the host serving ``url``."""
+    host = urlparse(url).netloc
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_MAX_REQUESTS_PER_HOST)
+        _host_semaphores[host] = semaphore
+    return semaphore
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Backoff delay before the next attempt, honouring Retry-After.
+
+    Retry-After is capped at the backoff ceiling so one slow host cannot
+    stall the whole search.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), _MAX_BACKOFF)
+        except ValueError:
+            pass  # HTTP-date form; use exponential backoff instead
+    return min(2**attempt, _MAX_BACKOFF) + random.random() * 0.25
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, Any] | None = None,
+    max_attempts: int = 3,
+) -> httpx.Response:
+    """GET with per-host concurrency limit and backoff on 429/5xx.
+
+    Returns the last response received; callers still check the status.
+    """
+    semaphore = _host_semaphore(url)
+    for attempt in range(max_attempts):
+        async with semaphore:
+            response = await client.get(url, params=params)
+
+        if response.status_code != 429 and response.status_code < 500:
+            return response
+        if attempt == max_attempts - 1:
+            break
+
+        delay = _retry_delay(response, attempt)
+        logger.info(f"Got {response.status_code} from {url}, retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+    return response
+
 
 class JobAdapter(ABC):
     """Base class for job board adapters."""
@@ -22,6 +89,31 @@ class JobAdapter(ABC):
         """Search for jobs matching the filters."""
         pass
 
+    def iter_board_fetches(
+        self, client: httpx.AsyncClient, filters: SearchFilters
+    ) -> Iterator[tuple[str, Awaitable[list[JobPosting]]]]:
+        """Yield ``(label, fetch)`` pairs that together cover ``search``.
+
+        Adapters backed by company boards yield one fetch per company, all
+        sharing ``client``; other adapters yield their whole ``search``.
+        """
+        boards = self._company_boards()
+        if not boards:
+            yield type(self).__name__, self.search(filters)
+            return
+        for company in boards:
+            yield company["name"], self._fetch_company_jobs(client, company, filters)
+
+    def _company_boards(self) -> list[dict[str, str]]:
+        """Company boards fetched via ``_fetch_company_jobs``, if any."""
+        return []
+
+    async def _fetch_company_jobs(
+        self, client: httpx.AsyncClient, company: dict[str, str], filters: SearchFilters
+    ) -> list[JobPosting]:
+        """Fetch one company board; required when ``_company_boards`` is set."""
+        raise NotImplementedError
+
 
 class GreenhouseAdapter(JobAdapter):
     """Adapter for Greenhouse public job boards."""
@@ -49,6 +141,9 @@ class GreenhouseAdapter(JobAdapter):
 
         return all_jobs
 
+    def _company_boards(self) -> list[dict[str, str]]:
+        return self.GREENHOUSE_COMPANIES
+
     async def _fetch_company_jobs(
         self, client: httpx.AsyncClient, company: dict[str, str], filters: SearchFilters
     ) -> list[JobPosting]:
@@ -56,7 +151,7 @@ class GreenhouseAdapter(JobAdapter):
         board_token = company["board_token"]
         url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
 
-        response = await client.get(url)
+        response = await _get_with_retry(client, url)
         if response.status_code != 200:
             logger.warning(f"Greenhouse API returned {response.status_code} for {company['name']}")
             return []
@@ -96,9 +191,11 @@ class GreenhouseAdapter(JobAdapter):
         """Convert Greenhouse job to normalized JobPosting."""
         try:
             job_id = str(job.get("id", ""))
-            title = job.get("title", "")
-            location_obj = job.get("location", {})
-            location = location_obj.get("name", "Unknown")
+            # The boards send JSON null for missing fields, and
+            # model_construct below does not validate, so coerce here
+            title = job.get("title") or ""
+            location_obj = job.get("location") or {}
+            location = location_obj.get("name") or "Unknown"
 
             # Extract job description
             content = job.get("content", "")
@@ -109,7 +206,8 @@ class GreenhouseAdapter(JobAdapter):
             if not apply_url:
                 return None
 
-            return JobPosting(
+            # Fields are coerced to plain strings above, so skip revalidation
+            return JobPosting.model_construct(
                 id=f"gh_{company_name.lower()}_{job_id}",
                 title=title,
                 company=company_name,
@@ -160,6 +258,9 @@ class LeverAdapter(JobAdapter):
 
         return all_jobs
 
+    def _company_boards(self) -> list[dict[str, str]]:
+        return self.LEVER_COMPANIES
+
     async def _fetch_company_jobs(
         self, client: httpx.AsyncClient, company: dict[str, str], filters: SearchFilters
     ) -> list[JobPosting]:
@@ -168,7 +269,7 @@ class LeverAdapter(JobAdapter):
         url = f"https://api.lever.co/v0/postings/{lever_id}"
 
         params = {"mode": "json", "skip": 0, "limit": 100}
-        response = await client.get(url, params=params)
+        response = await _get_with_retry(client, url, params=params)
 
         if response.status_code != 200:
             logger.warning(f"Lever API returned {response.status_code} for {company['name']}")
@@ -209,21 +310,25 @@ class LeverAdapter(JobAdapter):
         """Convert Lever job to normalized JobPosting."""
         try:
             job_id = job.get("id", "")
-            title = job.get("text", "")
-            categories = job.get("categories", {})
-            location = categories.get("location", "Unknown")
+            # Coerce JSON nulls; model_construct below does not validate
+            title = job.get("text") or ""
+            categories = job.get("categories") or {}
+            location = categories.get("location") or "Unknown"
 
             # Extract job description
             description_obj = job.get("description", "")
             lists = job.get("lists", [])
 
-            # Combine description and lists
-            jd_parts = [description_obj]
-            for lst in lists:
-                content = lst.get("content", "")
-                jd_parts.append(content)
-
-            jd_html = "\n".join(jd_parts)
+            # Combine description and lists, skipping empty sections
+            jd_html = "\n".join(
+                part
+                for part in itertools.chain(
+                    [description_obj], (lst.get("content", "") for lst in lists)
+                )
+                if part
+            )
+            if not jd_html:
+                return None
 
             apply_url = job.get("hostedUrl", "")
             if not apply_url:
@@ -231,7 +336,7 @@ class LeverAdapter(JobAdapter):
             if not apply_url:
                 return None
 
-            return JobPosting(
+            return JobPosting.model_construct(
                 id=f"lever_{company_name.lower()}_{job_id}",
                 title=title,
                 company=company_name,
@@ -321,23 +426,32 @@ class GenericHTMLAdapter(JobAdapter):
     ) -> JobPosting | None:
         """Extract job information from HTML element."""
         try:
-            # Generic extraction - would need customization per site
-            title_elem = element.find(["h2", "h3", "h4"])
+            # Generic extraction - would need customization per site.
+            # Walk the subtree once, picking up the first heading, link and
+            # location element instead of running a find() per field.
+            title_elem = link_elem = location_elem = None
+            for child in element.descendants:
+                if not isinstance(child, Tag):
+                    continue
+                if title_elem is None and child.name in _HEADING_TAGS:
+                    title_elem = child
+                if link_elem is None and child.name == "a" and child.has_attr("href"):
+                    link_elem = child
+                if location_elem is None and any(
+                    _LOCATION_RE.search(cls) for cls in child.get("class") or ()
+                ):
+                    location_elem = child
+                if None not in (title_elem, link_elem, location_elem):
+                    break
+
             title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
 
-            # Try to find link
-            link_elem = element.find("a", href=True)
-            apply_url = ""
-            if link_elem:
-                href = link_elem["href"]
-                apply_url = urljoin(base_url, href)
+            apply_url = urljoin(base_url, link_elem["href"]) if link_elem else ""
 
             # Extract company from URL or element
             parsed = urlparse(base_url)
             company = parsed.netloc.replace("www.", "").split(".")[0].title()
 
-            # Extract location
-            location_elem = element.find(class_=re.compile(r"location", re.I))
             location = location_elem.get_text(strip=True) if location_elem else "Unknown"
 
             # Get description
@@ -355,8 +469,39 @@ class GenericHTMLAdapter(JobAdapter):
                 requirements="",
                 source="generic_html",
                 apply_url=apply_url,
-                raw_data={"html_snippet": str(element)[:500]},
             )
         except Exception as exc:
             logger.warning(f"Failed to extract job from element: {exc}")
             return None
+
+
+async def search_all(
+    adapters: list[JobAdapter], filters: SearchFilters
+) -> list[JobPosting]:
+    """Search several adapters in one concurrent wave.
+
+    Company-board adapters contribute one task per company, sharing a single
+    HTTP client; other adapters run their ``search`` as one task. All tasks
+    are gathered together behind a global concurrency limit.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+
+    async def bounded(
+        label: str, coro: Awaitable[list[JobPosting]]
+    ) -> list[JobPosting]:
+        async with semaphore:
+            try:
+                return await coro
+            except Exception as exc:
+                logger.warning(f"Failed to fetch jobs from {label}: {exc}")
+                return []
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        tasks = [
+            bounded(label, fetch)
+            for adapter in adapters
+            for label, fetch in adapter.iter_board_fetches(client, filters)
+        ]
+        results = await asyncio.gather(*tasks)
+
+    return [posting for postings in results for posting in postings]
@@ -1,23 +1,33 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
 import re
 from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
+import orjson
 from fastapi import FastAPI, HTTPException, status
 
-from .adapters import GreenhouseAdapter, LeverAdapter, WorkdayAdapter
+from .adapters import GreenhouseAdapter, LeverAdapter, WorkdayAdapter, search_all
 from .models import JobPosting, SearchFilters, SearchResponse
-from .rate_limiter import RateLimiter, RobotsChecker
+from .rate_limiter import RateLimiter, RobotsChecker, close_robots_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Job Finder Service")
 
+# Pooled HTTP client shared by all requests to the storage service
+_client = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=300
+    ),
+)
+
 # Global instances
 rate_limiter = RateLimiter(requests_per_second=2.0)
 robots_checker = RobotsChecker()
@@ -28,71 +38,139 @@ lever_adapter = LeverAdapter()
 workday_adapter = WorkdayAdapter()
 
 
-def _storage_service_url() -> str:
-    """Get storage service URL from environment."""
-    host = os.getenv("STORAGE_SERVICE_HOST", "localhost")
-    port = os.getenv("STORAGE_SERVICE_PORT", "8000")
-    return f"http://{host}:{port}"
+_INVALID_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+_WS_DASH = re.compile(r"[\s\-]+")
+_TRAILING_DIGITS = re.compile(r"(\d+)$")
+
+# Ad click IDs dropped from apply URLs, along with every utm_* parameter.
+# Generic names such as ``source`` or ``ref`` are kept, since a board may use
+# them to tell postings apart.
+_TRACKING_PARAMS = frozenset({"gclid", "fbclid", "msclkid", "dclid"})
+
+
+# Storage service URL, resolved once from the environment at import time
+_STORAGE_URL = (
+    f"http://{os.getenv('STORAGE_SERVICE_HOST', 'localhost')}"
+    f":{os.getenv('STORAGE_SERVICE_PORT', '8000')}"
+)
+
+# Whether job.json includes the raw source payload (SAVE_RAW_DATA=1)
+_SAVE_RAW_DATA = os.getenv("SAVE_RAW_DATA", "0") == "1"
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize an apply URL for deduplication.
+
+    Lowercases the scheme and host and drops the fragment and tracking query
+    parameters. Other query parameters are kept, since some boards identify
+    the job through them (e.g. ``?gh_jid=123``).
+    """
+    parts = urlsplit(url)
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.startswith("utm_") and key not in _TRACKING_PARAMS
+        )
+    )
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, "")
+    )
+
+
+def _dedupe_postings(postings: list[JobPosting]) -> list[JobPosting]:
+    """Drop repeated postings, keeping the first one seen.
+
+    A posting is a repeat if its (source, id) or its canonical apply URL was
+    already seen.
+    """
+    seen_ids: set[tuple[str, str]] = set()
+    seen_urls: set[str] = set()
+    unique_postings: list[JobPosting] = []
+    for posting in postings:
+        id_key = (posting.source, posting.id)
+        url_key = _canonical_url(posting.apply_url)
+        if id_key in seen_ids or url_key in seen_urls:
+            continue
+        seen_ids.add(id_key)
+        seen_urls.add(url_key)
+        unique_postings.append(posting)
+    return unique_postings
 
 
 def _sanitize_for_path(text: str) -> str:
     """Sanitize text for use in file paths."""
     # Remove/replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', "", text)
+    sanitized = text.translate(_INVALID_CHARS)
     # Replace spaces and other chars with underscore
-    sanitized = re.sub(r"[\s\-]+", "_", sanitized)
+    sanitized = _WS_DASH.sub("_", sanitized)
     # Limit length
     return sanitized[:50]
 
 
-async def _save_job_to_storage(job: JobPosting) -> bool:
-    """Save job posting to storage service."""
-    try:
-        # Create job folder path: jobs/{company}_{title}_{id}/
-        company_clean = _sanitize_for_path(job.company)
-        title_clean = _sanitize_for_path(job.title)
-        # Extract numeric ID if possible, otherwise use last part
-        id_match = re.search(r"(\d+)$", job.id)
-        job_id_clean = id_match.group(1) if id_match else _sanitize_for_path(job.id.split("_")[-1])
-
-        job_folder = f"jobs/{company_clean}_{title_clean}_{job_id_clean}"
-        job_file_path = f"{job_folder}/job.json"
-
-        # Prepare job data
-        job_data = {
-            "id": job.id,
-            "title": job.title,
-            "company": job.company,
-            "location": job.location,
-            "jd_text": job.jd_text,
-            "requirements": job.requirements,
-            "source": job.source,
-            "apply_url": job.apply_url,
-            "raw_data": job.raw_data,
-        }
+def _job_storage_payload(job: JobPosting) -> tuple[str, str]:
+    """Build the job folder and serialized job.json content for a posting.
+
+    Returns:
+        Tuple of (job folder path, job.json content)
+    """
+    # Create job folder path: jobs/{company}_{title}_{id}/
+    company_clean = _sanitize_for_path(job.company)
+    title_clean = _sanitize_for_path(job.title)
+    # Extract numeric ID if possible, otherwise use last part
+    id_match = _TRAILING_DIGITS.search(job.id)
+    if id_match:
+        job_id_clean = id_match.group(1)
+    else:
+        job_id_clean = _sanitize_for_path(job.id.split("_")[-1])
+
+    job_folder = f"jobs/{company_clean}_{title_clean}_{job_id_clean}"
+
+    # Prepare job data; the raw adapter payload is only kept when opted in
+    job_data = job.model_dump(exclude=None if _SAVE_RAW_DATA else {"raw_data"})
 
+    return job_folder, orjson.dumps(job_data).decode()
+
+
+async def _save_job_to_storage(
+    job: JobPosting, job_folder: str, content: str, client: httpx.AsyncClient
+) -> bool:
+    """Save job posting to storage service.
+
+    Args:
+        job: Job posting being saved
+        job_folder: Folder built by _job_storage_payload
+        content: Serialized job.json content
+        client: Shared HTTP client for the storage service
+    """
+    try:
         # Write to storage service
-        storage_url = _storage_service_url()
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{storage_url}/write",
-                json={"path": job_file_path, "content": json.dumps(job_data, indent=2), "kind": "text"},
+        response = await client.post(
+            f"{_STORAGE_URL}/write",
+            json={"path": f"{job_folder}/job.json", "content": content, "kind": "text"},
+        )
+
+        if response.status_code == 200:
+            logger.info(f"Saved job {job.id} to {job_folder}")
+            return True
+        else:
+            logger.warning(
+                f"Failed to save job {job.id}: {response.status_code} - {response.text}"
             )
-
-            if response.status_code == 200:
-                logger.info(f"Saved job {job.id} to {job_folder}")
-                return True
-            else:
-                logger.warning(
-                    f"Failed to save job {job.id}: {response.status_code} - {response.text}"
-                )
-                return False
+            return False
 
     except Exception as exc:
         logger.error(f"Error saving job {job.id}: {exc}")
         return False
 
 
+@app.on_event("shutdown")
+async def _close_http_client() -> None:
+    """Close pooled HTTP connections on shutdown."""
+    await _client.aclose()
+    await close_robots_client()
+
+
 @app.get("/healthz")
 async def healthz() -> dict[str, str]:
     """Return service health status."""
@@ -111,52 +189,35 @@ async def search_jobs(filters: SearchFilters) -> SearchResponse:
     """
     logger.info(f"Searching with filters: {filters.model_dump()}")
 
-    all_postings: list[JobPosting] = []
-
-    # Search Greenhouse
-    try:
-        greenhouse_jobs = await greenhouse_adapter.search(filters)
-        all_postings.extend(greenhouse_jobs)
-        logger.info(f"Found {len(greenhouse_jobs)} jobs from Greenhouse")
-    except Exception as exc:
-        logger.error(f"Greenhouse search failed: {exc}")
-
-    # Search Lever
-    try:
-        lever_jobs = await lever_adapter.search(filters)
-        all_postings.extend(lever_jobs)
-        logger.info(f"Found {len(lever_jobs)} jobs from Lever")
-    except Exception as exc:
-        logger.error(f"Lever search failed: {exc}")
-
-    # Search Workday (currently returns empty)
-    try:
-        workday_jobs = await workday_adapter.search(filters)
-        all_postings.extend(workday_jobs)
-        logger.info(f"Found {len(workday_jobs)} jobs from Workday")
-    except Exception as exc:
-        logger.error(f"Workday search failed: {exc}")
+    # Fetch every company board of every source in one concurrent wave
+    # (Workday currently returns empty); failed boards are logged and skipped
+    all_postings = await search_all(
+        [greenhouse_adapter, lever_adapter, workday_adapter], filters
+    )
+    logger.info(f"Found {len(all_postings)} jobs across all sources")
 
-    # Deduplicate by apply_url
-    seen_urls: set[str] = set()
-    unique_postings: list[JobPosting] = []
-    for posting in all_postings:
-        if posting.apply_url not in seen_urls:
-            seen_urls.add(posting.apply_url)
-            unique_postings.append(posting)
+    unique_postings = _dedupe_postings(all_postings)
 
     logger.info(f"Total unique jobs found: {len(unique_postings)}")
 
     # Save a subset of jobs to storage (to avoid overwhelming storage)
-    saved_count = 0
     jobs_to_save = unique_postings[:10]  # Save first 10 jobs
 
-    for job in jobs_to_save:
-        success = await _save_job_to_storage(job)
-        if success:
-            saved_count += 1
+    # Path sanitisation and serialisation run in a worker thread so only
+    # the HTTP writes happen on the event loop
+    payloads = await asyncio.to_thread(
+        lambda: [_job_storage_payload(job) for job in jobs_to_save]
+    )
+    results = await asyncio.gather(
+        *(
+            _save_job_to_storage(job, job_folder, content, _client)
+            for job, (job_folder, content) in zip(jobs_to_save, payloads)
+        )
+    )
+    saved_count = sum(results)
 
-    return SearchResponse(
+    # Postings were built by the adapters, which are the validation boundary
+    return SearchResponse.model_construct(
         postings=unique_postings,
         total_found=len(unique_postings),
         saved_count=saved_count,
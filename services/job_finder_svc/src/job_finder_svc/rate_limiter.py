@@ -3,8 +3,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from collections import defaultdict
-from typing import DefaultDict
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
@@ -12,6 +10,19 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Pooled HTTP client for robots.txt fetches
+_client = httpx.AsyncClient(
+    timeout=10.0,
+    limits=httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=300
+    ),
+)
+
+
+async def close_robots_client() -> None:
+    """Close the pooled robots.txt HTTP client."""
+    await _client.aclose()
+
 
 class RateLimiter:
     """Simple rate limiter with per-domain tracking."""
@@ -19,19 +30,19 @@ class RateLimiter:
     def __init__(self, requests_per_second: float = 1.0) -> None:
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second
-        self.last_request: DefaultDict[str, float] = defaultdict(float)
+        self.last_request: dict[str, float] = {}
 
     async def acquire(self, domain: str) -> None:
         """Wait if necessary to respect rate limit for domain."""
-        now = time.time()
-        last = self.last_request[domain]
+        now = time.monotonic()
+        last = self.last_request.get(domain, 0.0)
         elapsed = now - last
 
         if elapsed < self.min_interval:
             wait_time = self.min_interval - elapsed
             await asyncio.sleep(wait_time)
 
-        self.last_request[domain] = time.time()
+        self.last_request[domain] = time.monotonic()
 
 
 class RobotsChecker:
@@ -40,6 +51,8 @@ class RobotsChecker:
     def __init__(self) -> None:
         self.parsers: dict[str, RobotFileParser] = {}
         self.user_agent = "JobSearchBot/1.0"
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_guard = asyncio.Lock()
 
     async def can_fetch(self, url: str) -> bool:
         """Check if URL can be fetched according to robots.txt."""
@@ -47,7 +60,13 @@ class RobotsChecker:
         base_url = f"{parsed.scheme}://{parsed.netloc}"
 
         if base_url not in self.parsers:
-            await self._load_robots(base_url)
+            async with self._lock_guard:
+                lock = self._locks.setdefault(base_url, asyncio.Lock())
+            # Only one task fetches robots.txt per domain; the rest wait and
+            # reuse the parsed result.
+            async with lock:
+                if base_url not in self.parsers:
+                    await self._load_robots(base_url)
 
         parser = self.parsers.get(base_url)
         if parser is None:
@@ -63,13 +82,14 @@ class RobotsChecker:
         parser.set_url(robots_url)
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(robots_url)
-                if response.status_code == 200:
-                    parser.parse(response.text.splitlines())
-                    logger.info(f"Loaded robots.txt from {robots_url}")
-                else:
-                    logger.info(f"No robots.txt at {robots_url} (status {response.status_code})")
+            response = await _client.get(robots_url)
+            if response.status_code == 200:
+                await asyncio.to_thread(parser.parse, response.text.splitlines())
+                logger.info(f"Loaded robots.txt from {robots_url}")
+            else:
+                logger.info(
+                    f"No robots.txt at {robots_url} (status {response.status_code})"
+                )
         except Exception as exc:
             logger.warning(f"Failed to load robots.txt from {robots_url}: {exc}")
 
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
 import re
 
 import httpx
+import orjson
 from fastapi import FastAPI, HTTPException
 
-from .models import RankRequest, RankResponse, RankedJob
+from .models import FitScore, JobPosting, RankRequest, RankResponse, RankedJob
 from .ranker import JobRanker
 
 logging.basicConfig(level=logging.INFO)
@@ -16,28 +17,46 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Job Ranker Service")
 
+# Pooled HTTP client shared by all requests to the storage service
+_client = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=300
+    ),
+)
+
 # Global ranker instance
-ranker = JobRanker()
+ranker = JobRanker(client=_client)
+
+
+_INVALID_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+_WS_DASH = re.compile(r"[\s\-]+")
+_TRAILING_DIGITS = re.compile(r"(\d+)$")
 
+# Number of top-ranked jobs that get a fit report saved
+_FIT_REPORT_TOP_K = 10
 
-def _storage_service_url() -> str:
-    """Get storage service URL from environment."""
-    host = os.getenv("STORAGE_SERVICE_HOST", "localhost")
-    port = os.getenv("STORAGE_SERVICE_PORT", "8000")
-    return f"http://{host}:{port}"
+
+# Storage service URL, resolved once from the environment at import time
+_STORAGE_URL = (
+    f"http://{os.getenv('STORAGE_SERVICE_HOST', 'localhost')}"
+    f":{os.getenv('STORAGE_SERVICE_PORT', '8000')}"
+)
 
 
 def _sanitize_for_path(text: str) -> str:
     """Sanitize text for use in file paths."""
     # Remove/replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', "", text)
+    sanitized = text.translate(_INVALID_CHARS)
     # Replace spaces and other chars with underscore
-    sanitized = re.sub(r"[\s\-]+", "_", sanitized)
+    sanitized = _WS_DASH.sub("_", sanitized)
     # Limit length
     return sanitized[:50]
 
 
-async def _save_fit_report(job_id: str, company: str, title: str, fit_data: dict) -> bool:
+async def _save_fit_report(
+    job_id: str, company: str, title: str, fit_data: dict, client: httpx.AsyncClient
+) -> bool:
     """Save fit report to storage service.
 
     Args:
@@ -45,6 +64,7 @@ async def _save_fit_report(job_id: str, company: str, title: str, fit_data: dict
         company: Company name
         title: Job title
         fit_data: Fit score data to save
+        client: Shared HTTP client for the storage service
 
     Returns:
         True if saved successfully, False otherwise
@@ -56,7 +76,7 @@ async def _save_fit_report(job_id: str, company: str, title: str, fit_data: dict
         title_clean = _sanitize_for_path(title)
 
         # Extract numeric ID if possible, otherwise use last part
-        id_match = re.search(r"(\d+)$", job_id)
+        id_match = _TRAILING_DIGITS.search(job_id)
         job_id_clean = id_match.group(1) if id_match else _sanitize_for_path(job_id.split("_")[-1])
 
         # Create path: jobs/{company}_{title}_{id}/fit_report.json
@@ -64,31 +84,51 @@ async def _save_fit_report(job_id: str, company: str, title: str, fit_data: dict
         fit_report_path = f"{job_folder}/fit_report.json"
 
         # Write to storage service
-        storage_url = _storage_service_url()
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{storage_url}/write",
-                json={
-                    "path": fit_report_path,
-                    "content": json.dumps(fit_data, indent=2),
-                    "kind": "text",
-                },
+        response = await client.post(
+            f"{_STORAGE_URL}/write",
+            json={
+                "path": fit_report_path,
+                "content": orjson.dumps(fit_data).decode(),
+                "kind": "text",
+            },
+        )
+
+        if response.status_code == 200:
+            logger.info(f"Saved fit report for job {job_id} to {job_folder}")
+            return True
+        else:
+            logger.warning(
+                f"Failed to save fit report for job {job_id}: "
+                f"{response.status_code} - {response.text}"
             )
-
-            if response.status_code == 200:
-                logger.info(f"Saved fit report for job {job_id} to {job_folder}")
-                return True
-            else:
-                logger.warning(
-                    f"Failed to save fit report for job {job_id}: {response.status_code} - {response.text}"
-                )
-                return False
+            return False
 
     except Exception as exc:
         logger.error(f"Error saving fit report for job {job_id}: {exc}")
         return False
 
 
+def _fit_report_data(job: JobPosting, fit_score: FitScore) -> dict:
+    """Build the fit report payload saved alongside a job."""
+    return {
+        "job_id": job.id,
+        "score": fit_score.score,
+        "matched_skills": fit_score.matched_skills,
+        "gaps": fit_score.gaps,
+        "seniority_match": fit_score.seniority_match,
+        "explanation": fit_score.explanation,
+        "job_title": job.title,
+        "company": job.company,
+        "location": job.location,
+    }
+
+
+@app.on_event("shutdown")
+async def _close_http_client() -> None:
+    """Close pooled HTTP connections on shutdown."""
+    await _client.aclose()
+
+
 @app.get("/healthz")
 async def healthz() -> dict[str, str]:
     """Return service health status."""
@@ -110,39 +150,39 @@ async def rank_jobs(request: RankRequest) -> RankResponse:
     if not request.jobs:
         return RankResponse(ranked_jobs=[], total_jobs=0, saved_reports=0)
 
-    # Rank jobs
-    scored_jobs = ranker.rank_jobs(request.profile, request.jobs)
+    # Rank jobs; select enough to cover both the response and the fit reports
+    top_k = request.top_n
+    if top_k is not None:
+        top_k = max(top_k, _FIT_REPORT_TOP_K)
+    scored_jobs = await ranker.rank_jobs(request.profile, request.jobs, top_k=top_k)
 
     # Build response
-    ranked_jobs: list[RankedJob] = []
-    saved_count = 0
-
-    for job, fit_score in scored_jobs:
-        ranked_jobs.append(RankedJob(job=job, fit_score=fit_score))
-
-        # Save fit report for top 10 jobs
-        if len(ranked_jobs) <= 10:
-            fit_data = {
-                "job_id": job.id,
-                "score": fit_score.score,
-                "matched_skills": fit_score.matched_skills,
-                "gaps": fit_score.gaps,
-                "seniority_match": fit_score.seniority_match,
-                "explanation": fit_score.explanation,
-                "job_title": job.title,
-                "company": job.company,
-                "location": job.location,
-            }
-
-            success = await _save_fit_report(job.id, job.company, job.title, fit_data)
-            if success:
-                saved_count += 1
+    # Jobs and scores are already validated models, so skip revalidation
+    ranked_jobs = [
+        RankedJob.model_construct(job=job, fit_score=fit_score)
+        for job, fit_score in scored_jobs[: request.top_n]
+    ]
+
+    # Save fit reports for the final top jobs only
+    results = await asyncio.gather(
+        *(
+            _save_fit_report(
+                job.id,
+                job.company,
+                job.title,
+                _fit_report_data(job, fit_score),
+                _client,
+            )
+            for job, fit_score in scored_jobs[:_FIT_REPORT_TOP_K]
+        )
+    )
+    saved_count = sum(results)
 
     logger.info(f"Ranked {len(ranked_jobs)} jobs, saved {saved_count} fit reports")
 
-    return RankResponse(
+    return RankResponse.model_construct(
         ranked_jobs=ranked_jobs,
-        total_jobs=len(ranked_jobs),
+        total_jobs=len(request.jobs),
         saved_reports=saved_count,
     )
 
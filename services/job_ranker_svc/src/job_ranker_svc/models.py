@@ -53,6 +53,9 @@ class RankRequest(BaseModel):
 
     profile: Profile
     jobs: list[JobPosting]
+    top_n: int | None = Field(
+        default=None, ge=1, description="Only return the top N jobs"
+    )
 
 
 class RankResponse(BaseModel):
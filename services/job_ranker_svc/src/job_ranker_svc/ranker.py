@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import heapq
 import logging
 import math
 import os
@@ -8,64 +9,121 @@ import re
 from typing import Any
 
 import httpx
+import orjson
 
 from .models import FitScore, JobPosting, Profile
 
 logger = logging.getLogger(__name__)
 
+# Word-like tokens used for skill matching (keeps "c++", "c#", "node.js")
+_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+
+_ANALYSIS_INSTRUCTIONS = """Provide analysis in JSON format:
+{
+  "score": <0-100>,
+  "matched_skills": ["skill1", "skill2", ...],
+  "gaps": ["gap1", "gap2", ...],
+  "seniority_match": "Excellent|Good|Fair|Poor",
+  "explanation": "Brief explanation of the fit"
+}
+
+Focus on:
+1. Skills alignment (technical and domain)
+2. Seniority/level match
+3. Location and remote work compatibility
+4. Job title alignment with career goals
+
+Return ONLY valid JSON."""
+
+
+def _score_key(item: tuple[JobPosting, FitScore]) -> int:
+    """Sort key for a (job, fit_score) pair: its fit score."""
+    return item[1].score
+
 
 class JobRanker:
     """Ranks jobs based on profile fit using LLM analysis."""
 
-    def __init__(self) -> None:
+    # Maximum concurrent LLM calls while ranking a batch of jobs
+    MAX_CONCURRENT_CALLS = 8
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        """Create a ranker that calls the LLM API through ``client``.
+
+        The client is owned by the caller, which closes it on shutdown.
+        """
         self.llm_provider = os.getenv("LLM_PROVIDER", "openai")
         self.llm_model = os.getenv("LLM_MODEL", "gpt-4o-mini")
         self.llm_api_key = os.getenv("LLM_API_KEY", "")
-
-    def rank_jobs(self, profile: Profile, jobs: list[JobPosting]) -> list[tuple[JobPosting, FitScore]]:
+        self._client = client
+
+    async def rank_jobs(
+        self,
+        profile: Profile,
+        jobs: list[JobPosting],
+        top_k: int | None = None,
+    ) -> list[tuple[JobPosting, FitScore]]:
         """Rank jobs by fit score.
 
+        Jobs are scored concurrently, with at most ``MAX_CONCURRENT_CALLS``
+        LLM requests in flight.
+
+        Args:
+            profile: Candidate profile
+            jobs: Jobs to score
+            top_k: If set, only the ``top_k`` best jobs are selected and returned
+
         Returns:
             List of (job, fit_score) tuples sorted by score descending
         """
-        scored_jobs: list[tuple[JobPosting, FitScore]] = []
-
-        for job in jobs:
-            try:
-                fit_score = self._score_job(profile, job)
-                scored_jobs.append((job, fit_score))
-            except Exception as exc:
-                logger.error(f"Failed to score job {job.id}: {exc}")
-                # Add default low score for failed jobs
-                fit_score = FitScore(
-                    job_id=job.id,
-                    score=0,
-                    matched_skills=[],
-                    gaps=["Error analyzing fit"],
-                    seniority_match="Unknown",
-                    explanation="Failed to analyze this job",
-                )
-                scored_jobs.append((job, fit_score))
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CALLS)
+        profile_block = self._prebuild_profile_block(profile)
+
+        async def score(job: JobPosting) -> FitScore:
+            async with semaphore:
+                try:
+                    fit_score = await self._score_job(profile, job, profile_block)
+                except Exception as exc:
+                    logger.error(f"Failed to score job {job.id}: {exc}")
+                    # Add default low score for failed jobs
+                    fit_score = FitScore(
+                        job_id=job.id,
+                        score=0,
+                        matched_skills=[],
+                        gaps=["Error analyzing fit"],
+                        seniority_match="Unknown",
+                        explanation="Failed to analyze this job",
+                    )
+            return fit_score
+
+        results = await asyncio.gather(*(score(job) for job in jobs))
+        scored_jobs = list(zip(jobs, results))
 
         # Sort by score descending
-        scored_jobs.sort(key=lambda x: x[1].score, reverse=True)
+        if top_k is not None:
+            return heapq.nlargest(top_k, scored_jobs, key=_score_key)
+        scored_jobs.sort(key=_score_key, reverse=True)
         return scored_jobs
 
-    def _score_job(self, profile: Profile, job: JobPosting) -> FitScore:
+    async def _score_job(
+        self, profile: Profile, job: JobPosting, profile_block: str
+    ) -> FitScore:
         """Score a single job against the profile using LLM."""
         # Use LLM to analyze fit
-        fit_analysis = self._llm_analyze_fit(profile, job)
+        fit_analysis = await self._llm_analyze_fit(profile, job, profile_block)
 
         # Parse LLM response
         return self._parse_fit_analysis(job.id, fit_analysis)
 
-    def _llm_analyze_fit(self, profile: Profile, job: JobPosting) -> str:
+    async def _llm_analyze_fit(
+        self, profile: Profile, job: JobPosting, profile_block: str
+    ) -> str:
         """Use LLM to analyze job fit."""
-        prompt = self._build_analysis_prompt(profile, job)
+        prompt = self._build_analysis_prompt(profile_block, job)
 
         try:
             if self.llm_provider.lower() == "openai":
-                return self._call_openai(prompt)
+                return await self._call_openai(prompt)
             else:
                 logger.warning(f"Unsupported LLM provider: {self.llm_provider}, using basic scoring")
                 return self._basic_scoring(profile, job)
@@ -73,26 +131,30 @@ class JobRanker:
             logger.error(f"LLM API call failed: {exc}")
             return self._basic_scoring(profile, job)
 
-    def _build_analysis_prompt(self, profile: Profile, job: JobPosting) -> str:
-        """Build prompt for LLM analysis."""
-        # Extract key profile info
+    @staticmethod
+    def _prebuild_profile_block(profile: Profile) -> str:
+        """Build the CANDIDATE PROFILE prompt section, shared by every job."""
         skills = ", ".join(profile.skills[:10])  # Top 10 skills
         target_titles = profile.preferences.get("target_titles", [])
         seniority = profile.preferences.get("seniority", "")
         location_pref = profile.preferences.get("location", "")
         remote_pref = profile.preferences.get("remote", "")
 
-        # Build job summary
-        jd_excerpt = job.jd_text[:1000] if len(job.jd_text) > 1000 else job.jd_text
-
-        prompt = f"""Analyze the fit between this candidate profile and job posting.
-
-CANDIDATE PROFILE:
+        return f"""CANDIDATE PROFILE:
 - Skills: {skills}
 - Target Titles: {", ".join(target_titles) if target_titles else "Not specified"}
 - Seniority: {seniority}
 - Location Preference: {location_pref}
-- Remote Preference: {remote_pref}
+- Remote Preference: {remote_pref}"""
+
+    def _build_analysis_prompt(self, profile_block: str, job: JobPosting) -> str:
+        """Build prompt for LLM analysis from a prebuilt profile block."""
+        # Build job summary
+        jd_excerpt = job.jd_text[:1000]
+
+        return f"""Analyze the fit between this candidate profile and job posting.
+
+{profile_block}
 
 JOB POSTING:
 - Title: {job.title}
@@ -100,26 +162,9 @@ JOB POSTING:
 - Location: {job.location}
 - Description: {jd_excerpt}
 
-Provide analysis in JSON format:
-{{
-  "score": <0-100>,
-  "matched_skills": ["skill1", "skill2", ...],
-  "gaps": ["gap1", "gap2", ...],
-  "seniority_match": "Excellent|Good|Fair|Poor",
-  "explanation": "Brief explanation of the fit"
-}}
-
-Focus on:
-1. Skills alignment (technical and domain)
-2. Seniority/level match
-3. Location and remote work compatibility
-4. Job title alignment with career goals
-
-Return ONLY valid JSON."""
+{_ANALYSIS_INSTRUCTIONS}"""
 
-        return prompt
-
-    def _call_openai(self, prompt: str) -> str:
+    async def _call_openai(self, prompt: str) -> str:
         """Call OpenAI API."""
         headers = {
             "Authorization": f"Bearer {self.llm_api_key}",
@@ -133,7 +178,7 @@ Return ONLY valid JSON."""
             "response_format": {"type": "json_object"},
         }
 
-        response = httpx.post(
+        response = await self._client.post(
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
             json=payload,
@@ -146,12 +191,22 @@ Return ONLY valid JSON."""
 
     def _basic_scoring(self, profile: Profile, job: JobPosting) -> str:
         """Fallback basic scoring without LLM."""
-        # Simple keyword matching
+        # Simple keyword matching: single-token skills are looked up in the
+        # job's token set, anything else falls back to a substring scan
         profile_skills_lower = [s.lower() for s in profile.skills]
         job_text_lower = job.jd_text.lower() + " " + job.title.lower()
+        tokens = {
+            variant
+            for token in _TOKEN_RE.findall(job_text_lower)
+            for variant in (token, token.strip("."))
+        }
 
-        matched_skills = [s for s in profile.skills if s.lower() in job_text_lower]
-        gaps = [s for s in profile.skills[:5] if s.lower() not in job_text_lower]
+        skill_found = [
+            s_l in tokens if _TOKEN_RE.fullmatch(s_l) else s_l in job_text_lower
+            for s_l in profile_skills_lower
+        ]
+        matched_skills = [s for s, found in zip(profile.skills, skill_found) if found]
+        gaps = [s for s, found in zip(profile.skills[:5], skill_found) if not found]
 
         # Simple scoring based on matched skills
         score = min(100, len(matched_skills) * 10 + 40)
@@ -177,12 +232,12 @@ Return ONLY valid JSON."""
             "explanation": f"Basic analysis: {len(matched_skills)} skills matched",
         }
 
-        return json.dumps(result)
+        return orjson.dumps(result).decode()
 
     def _parse_fit_analysis(self, job_id: str, analysis_json: str) -> FitScore:
         """Parse LLM JSON response into FitScore."""
         try:
-            data = json.loads(analysis_json)
+            data = orjson.loads(analysis_json)
 
             return FitScore(
                 job_id=job_id,
@@ -192,7 +247,7 @@ Return ONLY valid JSON."""
                 seniority_match=data.get("seniority_match", "Unknown"),
                 explanation=data.get("explanation", "No explanation provided"),
             )
-        except (json.JSONDecodeError, KeyError, ValueError) as exc:
+        except (orjson.JSONDecodeError, KeyError, ValueError) as exc:
             logger.error(f"Failed to parse fit analysis: {exc}")
             return FitScore(
                 job_id=job_id,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from email.message import EmailMessage
@@ -8,6 +9,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
 
+import aiofiles
 import aiosmtplib
 from fastapi import FastAPI, HTTPException
 from telegram import Bot
@@ -20,6 +22,47 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Notify Service")
 
+# Telegram bot, created on first use so its HTTP connections are reused
+_TELEGRAM_BOT: Bot | None = None
+
+
+def _get_bot(token: str) -> Bot:
+    """Return the shared Telegram bot, creating it on first use."""
+    global _TELEGRAM_BOT
+    if _TELEGRAM_BOT is None:
+        _TELEGRAM_BOT = Bot(token=token)
+    return _TELEGRAM_BOT
+
+
+@app.on_event("shutdown")
+async def _close_telegram_bot() -> None:
+    """Close the Telegram bot's HTTP session on shutdown."""
+    if _TELEGRAM_BOT is not None:
+        await _TELEGRAM_BOT.shutdown()
+
+
+def _format_body(message: str, links: list[dict]) -> str:
+    """Append links to a message body, one ``label: url`` line each."""
+    if not links:
+        return message
+    parts = [message, ""]
+    for link in links:
+        parts.append(f"{link.get('label', 'Link')}: {link.get('url', '')}")
+    return "\n".join(parts)
+
+
+async def _read_attachment(path: Path) -> bytes | None:
+    """Read an attachment without blocking the event loop.
+
+    Returns:
+        File contents, or None if the file does not exist
+    """
+    try:
+        async with aiofiles.open(path, "rb") as f:
+            return await f.read()
+    except FileNotFoundError:
+        return None
+
 
 @app.get("/healthz")
 async def healthz() -> dict[str, str]:
@@ -67,26 +110,20 @@ async def _send_email(
         msg["Subject"] = subject or "Notification"
 
         # Build email body with links
-        body_text = message
-        if links:
-            body_text += "\n\n"
-            for link in links:
-                label = link.get("label", "Link")
-                url = link.get("url", "")
-                body_text += f"\n{label}: {url}"
+        body_text = _format_body(message, links)
 
         msg.attach(MIMEText(body_text, "plain"))
 
-        # Attach files
-        for attachment_path in attachments:
-            path = Path(attachment_path)
-            if path.exists():
-                with open(path, "rb") as f:
-                    part = MIMEApplication(f.read(), Name=path.name)
-                    part["Content-Disposition"] = f'attachment; filename="{path.name}"'
-                    msg.attach(part)
-            else:
-                logger.warning(f"Attachment not found: {attachment_path}")
+        # Attach files, reading them concurrently and attaching in order
+        paths = [Path(attachment_path) for attachment_path in attachments]
+        contents = await asyncio.gather(*(_read_attachment(path) for path in paths))
+        for path, data in zip(paths, contents):
+            if data is None:
+                logger.warning(f"Attachment not found: {path}")
+                continue
+            part = MIMEApplication(data, Name=path.name)
+            part["Content-Disposition"] = f'attachment; filename="{path.name}"'
+            msg.attach(part)
 
         # Send email
         await aiosmtplib.send(
@@ -141,16 +178,10 @@ async def _send_telegram(
         )
 
     try:
-        bot = Bot(token=bot_token)
+        bot = _get_bot(bot_token)
 
         # Build message with links
-        full_message = message
-        if links:
-            full_message += "\n\n"
-            for link in links:
-                label = link.get("label", "Link")
-                url = link.get("url", "")
-                full_message += f"\n{label}: {url}"
+        full_message = _format_body(message, links)
 
         # Send message
         telegram_message = await bot.send_message(
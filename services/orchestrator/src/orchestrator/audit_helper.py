@@ -1,8 +1,10 @@
 """Helper functions for audit logging."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+import mmap
 import os
 from datetime import datetime
 from pathlib import Path
@@ -11,17 +13,115 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Pooled HTTP client shared by all audit service calls, opened by
+# start_audit_worker and closed by close_audit_client
+_client: httpx.AsyncClient | None = None
 
-def _audit_service_url() -> str:
-    """Get audit service URL."""
-    host = os.getenv("AUDIT_SERVICE_HOST", "localhost")
-    port = os.getenv("AUDIT_SERVICE_PORT", "8002")
-    return f"http://{host}:{port}"
+# Audit entries are queued and posted in batches by a background worker
+_AUDIT_BATCH_SIZE = 100
+_AUDIT_QUEUE_SIZE = 10_000
+_audit_queue: asyncio.Queue[dict] | None = None
+_audit_worker_task: asyncio.Task | None = None
+
+
+# Files at least this large are hashed through mmap, in _HASH_CHUNK_SIZE steps
+_MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Audit service URL, resolved once from the environment at import time
+_AUDIT_URL = (
+    f"http://{os.getenv('AUDIT_SERVICE_HOST', 'localhost')}"
+    f":{os.getenv('AUDIT_SERVICE_PORT', '8002')}"
+)
+
+
+def start_audit_worker() -> None:
+    """Open the audit client and start the worker that posts queued entries.
+
+    Must be called from a running event loop, e.g. a FastAPI startup hook.
+    Audit calls made before it is called are logged as errors and dropped.
+    """
+    global _client, _audit_queue, _audit_worker_task
+    _client = httpx.AsyncClient(timeout=10.0)
+    _audit_queue = asyncio.Queue(maxsize=_AUDIT_QUEUE_SIZE)
+    _audit_worker_task = asyncio.create_task(_audit_worker(_audit_queue))
+
+
+async def close_audit_client() -> None:
+    """Flush queued audit entries, stop the worker and close the client."""
+    global _client, _audit_queue, _audit_worker_task
+    if _audit_queue is not None and _audit_worker_task is not None:
+        await _audit_queue.join()
+        _audit_worker_task.cancel()
+        _audit_queue = _audit_worker_task = None
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _audit_client() -> httpx.AsyncClient:
+    """Return the audit client opened by start_audit_worker."""
+    if _client is None:
+        raise RuntimeError("Audit client is not open; call start_audit_worker first")
+    return _client
+
+
+async def _audit_worker(queue: asyncio.Queue[dict]) -> None:
+    """Post queued audit entries in batches until cancelled.
+
+    Args:
+        queue: Queue of audit entry payloads
+    """
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _AUDIT_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            await _post_audit_entries(batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+async def _post_audit_entries(entries: list[dict]) -> None:
+    """Post audit entries to the audit service in one request.
+
+    Falls back to posting entries one by one if the batch endpoint is not
+    available or one of the runs is missing.
+
+    Args:
+        entries: Audit entry payloads
+    """
+    try:
+        if len(entries) > 1:
+            response = await _audit_client().post(
+                f"{_AUDIT_URL}/audit/log/batch", json={"entries": entries}
+            )
+            if response.status_code == 200:
+                logger.debug(f"Logged {len(entries)} audit entries")
+                return
+            if response.status_code != 404:
+                logger.warning(f"Failed to log audit entries: {response.status_code}")
+                return
+
+        for entry in entries:
+            response = await _audit_client().post(f"{_AUDIT_URL}/audit/log", json=entry)
+
+            if response.status_code == 200:
+                logger.debug(f"Logged audit entry for {entry['operation']}")
+            else:
+                logger.warning(f"Failed to log audit entry: {response.status_code}")
+    except Exception as exc:
+        logger.error(f"Error logging audit entry: {exc}")
 
 
 def _compute_file_hash(file_path: str | Path) -> str:
     """Compute SHA256 hash of file.
 
+    The file is streamed through the hash rather than read into memory.
+    Large files are memory-mapped so the kernel can read ahead while the
+    previous chunk is being hashed.
+
     Args:
         file_path: Path to file
 
@@ -29,9 +129,17 @@ def _compute_file_hash(file_path: str | Path) -> str:
         Hex digest of hash, or empty string if file doesn't exist
     """
     try:
-        path = Path(file_path)
-        if path.exists():
-            return hashlib.sha256(path.read_bytes()).hexdigest()
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_HASH_THRESHOLD:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = hashlib.sha256()
+                with memoryview(mm) as view:
+                    for offset in range(0, len(view), _HASH_CHUNK_SIZE):
+                        digest.update(view[offset : offset + _HASH_CHUNK_SIZE])
+                return digest.hexdigest()
+    except FileNotFoundError:
+        pass
     except Exception as exc:
         logger.warning(f"Could not hash {file_path}: {exc}")
     return ""
@@ -48,21 +156,19 @@ async def create_audit_run(trigger: str, job_ids: list[str]) -> str:
         Run ID
     """
     try:
-        audit_url = _audit_service_url()
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{audit_url}/audit/run",
-                json={"trigger": trigger, "job_ids": job_ids},
-            )
+        response = await _audit_client().post(
+            f"{_AUDIT_URL}/audit/run",
+            json={"trigger": trigger, "job_ids": job_ids},
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                run_id = data["run_id"]
-                logger.info(f"Created audit run {run_id}")
-                return run_id
-            else:
-                logger.warning(f"Failed to create audit run: {response.status_code}")
-                return ""
+        if response.status_code == 200:
+            data = response.json()
+            run_id = data["run_id"]
+            logger.info(f"Created audit run {run_id}")
+            return run_id
+        else:
+            logger.warning(f"Failed to create audit run: {response.status_code}")
+            return ""
     except Exception as exc:
         logger.error(f"Error creating audit run: {exc}")
         return ""
@@ -82,6 +188,9 @@ async def log_audit_entry(
 ) -> None:
     """Log an audit entry.
 
+    Once the audit worker is running, the entry is queued and posted in a
+    batch. Entries are dropped with a warning if the queue is full.
+
     Args:
         run_id: Run ID
         operation: Operation type (PREPARE, APPLY, BUILD_CV, etc.)
@@ -97,36 +206,54 @@ async def log_audit_entry(
     if not run_id:
         return
 
+    entry = {
+        "run_id": run_id,
+        "operation": operation,
+        "timestamp_start": timestamp_start,
+        "timestamp_end": timestamp_end,
+        "status": status,
+        "prompt_redacted": prompt_redacted or "",
+        "tool_calls": tool_calls or [],
+        "artifacts": artifacts or [],
+        "error_message": error_message,
+        "metadata": metadata or {},
+    }
+
+    if _audit_queue is None:
+        await _post_audit_entries([entry])
+        return
+
     try:
-        audit_url = _audit_service_url()
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{audit_url}/audit/log",
-                json={
-                    "run_id": run_id,
-                    "operation": operation,
-                    "timestamp_start": timestamp_start,
-                    "timestamp_end": timestamp_end,
-                    "status": status,
-                    "prompt_redacted": prompt_redacted or "",
-                    "tool_calls": tool_calls or [],
-                    "artifacts": artifacts or [],
-                    "error_message": error_message,
-                    "metadata": metadata or {},
-                },
-            )
+        _audit_queue.put_nowait(entry)
+    except asyncio.QueueFull:
+        logger.warning(f"Audit queue full, dropping {operation} entry for run {run_id}")
 
-            if response.status_code == 200:
-                logger.debug(f"Logged audit entry for {operation}")
-            else:
-                logger.warning(f"Failed to log audit entry: {response.status_code}")
-    except Exception as exc:
-        logger.error(f"Error logging audit entry: {exc}")
+
+def _artifact_record(file_path: str, artifact_type: str) -> dict:
+    """Build an artifact record, hashing the file on the calling thread."""
+    try:
+        size_bytes = os.stat(file_path).st_size
+    except OSError:
+        # Missing file: record it without trying to hash it
+        return {
+            "path": str(file_path),
+            "type": artifact_type,
+            "hash": "",
+            "size_bytes": 0,
+        }
+    return {
+        "path": str(file_path),
+        "type": artifact_type,
+        "hash": _compute_file_hash(file_path),
+        "size_bytes": size_bytes,
+    }
 
 
-def create_artifact_record(file_path: str, artifact_type: str) -> dict:
+async def create_artifact_record(file_path: str, artifact_type: str) -> dict:
     """Create an artifact record with hash.
 
+    Hashing runs in a worker thread so it does not block the event loop.
+
     Args:
         file_path: Path to artifact file
         artifact_type: Type (cv, cover_letter, supplemental, screenshot, evidence)
@@ -134,10 +261,23 @@ def create_artifact_record(file_path: str, artifact_type: str) -> dict:
     Returns:
         Artifact record dict
     """
-    path = Path(file_path)
-    return {
-        "path": str(file_path),
-        "type": artifact_type,
-        "hash": _compute_file_hash(file_path),
-        "size_bytes": path.stat().st_size if path.exists() else 0,
-    }
+    return await asyncio.to_thread(_artifact_record, file_path, artifact_type)
+
+
+async def create_artifact_records(artifacts: list[tuple[str, str]]) -> list[dict]:
+    """Create artifact records for several files, hashing them in parallel.
+
+    Args:
+        artifacts: (file_path, artifact_type) pairs
+
+    Returns:
+        Artifact record dicts in the same order
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(_artifact_record, file_path, artifact_type)
+                for file_path, artifact_type in artifacts
+            )
+        )
+    )
@@ -1,18 +1,33 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import html
 import logging
 import os
 import re
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, NamedTuple
 
 import httpx
+import orjson
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from .audit_helper import create_artifact_record, create_audit_run, log_audit_entry
+from .audit_helper import (
+    close_audit_client,
+    create_artifact_record,
+    create_artifact_records,
+    create_audit_run,
+    log_audit_entry,
+    start_audit_worker,
+)
 from .models import (
     ApplicationStatus,
     ApplyRequest,
@@ -29,7 +44,66 @@ from .models import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Orchestrator")
+app = FastAPI(title="Orchestrator", default_response_class=ORJSONResponse)
+
+# Timestamp embedded in generated artifact file names, e.g. cv_20250101T120000Z.pdf
+_TS_RE = re.compile(r"_(\d{8}T\d{6}Z)")
+
+# Characters ignored when matching job IDs against job folder names
+_NORM_TBL = str.maketrans("", "", "_,")
+
+# Profile fields the job ranker reads; the rest of the profile is not sent
+_RANKER_PROFILE_FIELDS = ("skills", "preferences")
+
+# Job source system by job ID prefix, e.g. gh_company_12345
+_SOURCE_BY_PREFIX = {"gh": "greenhouse", "lever": "lever", "wd": "workday"}
+
+# How long a profile fetched from storage is reused before fetching it again
+_PROFILE_TTL_SECONDS = 60.0
+
+# Number of jobs whose documents are generated at the same time during /prepare
+_MAX_CONCURRENT_PREPARATIONS = 4
+
+# Last profile fetched from storage, as (time.monotonic() at fetch, profile)
+_profile_cache: tuple[float, dict] | None = None
+
+# Job folder index, as (jobs/ directory mtime_ns, index)
+_folder_index_cache: tuple[int, dict[str, Path]] | None = None
+
+# Last rendered review page and the dashboard cache entry it was rendered from
+_review_page_cache: tuple[_DashboardCache, str] | None = None
+
+# Shared Playwright instance and Chromium browser, started by the first
+# browser-based apply, and the number of applies that may use it at once
+_playwright: Any = None
+_browser: Any = None
+_browser_lock = asyncio.Lock()
+_MAX_BROWSER_CONTEXTS = int(os.getenv("ORCHESTRATOR_MAX_BROWSER_CONTEXTS", "2"))
+_browser_slots = asyncio.Semaphore(_MAX_BROWSER_CONTEXTS)
+
+# Last dashboard read from disk, and the lock serialising approve/reject edits
+_dashboard_cache: _DashboardCache | None = None
+_dashboard_lock = asyncio.Lock()
+
+# Maximum number of /prepare POSTs to downstream services in flight at once,
+# across all requests
+_MAX_INFLIGHT = int(os.getenv("ORCHESTRATOR_MAX_INFLIGHT", "20"))
+_inflight = asyncio.Semaphore(_MAX_INFLIGHT)
+
+# Pooled HTTP client shared by all calls to downstream services. The default
+# timeout covers job search and ranking; other calls pass their own timeout.
+# ORCHESTRATOR_HTTP2=1 lets concurrent calls share one connection per host
+# when the services are reached over TLS (requires the http2 extra). The pool
+# is sized above _MAX_INFLIGHT so gated POSTs never wait for a connection.
+_client = httpx.AsyncClient(
+    http2=os.getenv("ORCHESTRATOR_HTTP2", "0") == "1",
+    timeout=httpx.Timeout(300.0),
+    limits=httpx.Limits(
+        max_connections=_MAX_INFLIGHT * 3 + 20,
+        max_keepalive_connections=32,
+        keepalive_expiry=30.0,
+    ),
+)
 
 
 def _service_url(service_name: str, default_port: str) -> str:
@@ -39,158 +113,584 @@ def _service_url(service_name: str, default_port: str) -> str:
     return f"http://{host}:{port}"
 
 
-def _storage_service_url() -> str:
-    """Get storage service URL from environment."""
-    return _service_url("STORAGE_SERVICE", "8000")
+# Downstream service URLs, resolved once from the environment at import time
+_STORAGE_URL = _service_url("STORAGE_SERVICE", "8000")
+_JOB_FINDER_URL = _service_url("JOB_FINDER_SERVICE", "9000")
+_JOB_RANKER_URL = _service_url("JOB_RANKER_SERVICE", "9001")
+_CV_BUILDER_URL = _service_url("CV_BUILDER_SERVICE", "9002")
+_DOC_BUILDER_URL = _service_url("DOC_BUILDER_SERVICE", "9003")
+_NOTIFY_URL = _service_url("NOTIFY_SERVICE", "8001")
 
 
-def _job_finder_url() -> str:
-    """Get job finder service URL."""
-    return _service_url("JOB_FINDER_SERVICE", "9000")
+@lru_cache(maxsize=None)
+def _jobsearch_home() -> Path:
+    """Get JOBSEARCH_HOME directory, read once and cached."""
+    home = os.getenv("JOBSEARCH_HOME", str(Path.home() / "JobSearch"))
+    return Path(home)
 
 
-def _job_ranker_url() -> str:
-    """Get job ranker service URL."""
-    return _service_url("JOB_RANKER_SERVICE", "9001")
+def _json(response: httpx.Response) -> Any:
+    """Parse a downstream JSON response body with orjson."""
+    return orjson.loads(response.content)
 
 
-def _cv_builder_url() -> str:
-    """Get CV builder service URL."""
-    return _service_url("CV_BUILDER_SERVICE", "9002")
+async def _load_profile() -> dict:
+    """Load canonical profile from storage, reusing it for a short TTL."""
+    global _profile_cache
+    if _profile_cache and time.monotonic() - _profile_cache[0] < _PROFILE_TTL_SECONDS:
+        return _profile_cache[1]
 
+    response = await _client.get(f"{_STORAGE_URL}/profile", timeout=30.0)
+    if response.status_code != 200:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    profile = _json(response)
+    _profile_cache = (time.monotonic(), profile)
+    return profile
 
-def _doc_builder_url() -> str:
-    """Get document builder service URL."""
-    return _service_url("DOC_BUILDER_SERVICE", "9003")
 
+def _norm(text: str) -> str:
+    """Normalize a job ID or folder name for matching."""
+    return text.translate(_NORM_TBL).lower()
 
-def _notify_service_url() -> str:
-    """Get notify service URL."""
-    return _service_url("NOTIFY_SERVICE", "8001")
 
+def _build_folder_index() -> dict[str, Path]:
+    """Index job folders by normalized folder name.
 
-def _jobsearch_home() -> Path:
-    """Get JOBSEARCH_HOME directory."""
-    home = os.getenv("JOBSEARCH_HOME", str(Path.home() / "JobSearch"))
-    return Path(home)
+    Built once per /prepare call so matching a job to its folder needs no
+    further directory scans.
 
+    Returns:
+        Dict of normalized folder name to folder path, in directory order
+    """
+    jobs_dir = _jobsearch_home() / "jobs"
+    try:
+        with os.scandir(jobs_dir) as entries:
+            return {
+                _norm(entry.name): Path(entry.path)
+                for entry in entries
+                if entry.is_dir()
+            }
+    except OSError as exc:
+        logger.warning(f"Could not index job folders in {jobs_dir}: {exc}")
+        return {}
 
-async def _load_profile() -> dict:
-    """Load canonical profile from storage."""
-    storage_url = _storage_service_url()
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(f"{storage_url}/profile")
-        if response.status_code != 200:
-            raise HTTPException(status_code=404, detail="Profile not found")
-        return response.json()
 
+def _cached_folder_index() -> dict[str, Path]:
+    """Return the job folder index, rebuilding it only when jobs/ changes.
 
-def _extract_paths_from_response(response_data: dict, job_id: str) -> tuple[str, str, str]:
-    """Extract file paths from service response.
+    Adding, removing or renaming a job folder updates the directory's
+    mtime, which invalidates the cached index.
 
     Returns:
-        Tuple of (markdown_path, html_path, pdf_path)
+        Dict of normalized folder name to folder path
     """
-    jobsearch_home = _jobsearch_home()
-
-    # Find job folder
+    global _folder_index_cache
+    jobs_dir = _jobsearch_home() / "jobs"
     try:
-        normalized_job_id = job_id.replace("_", "").replace(",", "").lower()
-
-        for folder in (jobsearch_home / "jobs").iterdir():
-            if folder.is_dir():
-                normalized_folder = folder.name.replace("_", "").replace(",", "").lower()
-                if normalized_job_id in normalized_folder:
-                    # Extract timestamp from response or use latest file
-                    pdf_path = response_data.get("pdf_path", "")
-
-                    if pdf_path and Path(pdf_path).exists():
-                        # Extract timestamp from PDF filename
-                        timestamp_match = re.search(r"_(\d{8}T\d{6}Z)", pdf_path)
-                        if timestamp_match:
-                            timestamp = timestamp_match.group(1)
-                            return (
-                                str(folder / f"cv_{timestamp}.md"),
-                                str(folder / f"cv_{timestamp}.html"),
-                                pdf_path,
-                            )
+        mtime_ns = jobs_dir.stat().st_mtime_ns
+    except OSError:
+        return {}
 
-                    # Fallback: find latest files
-                    md_files = list(folder.glob("cv_*.md"))
-                    if md_files:
-                        latest_md = max(md_files, key=lambda p: p.stat().st_mtime)
-                        timestamp = latest_md.stem.split("_")[-1]
-                        return (
-                            str(latest_md),
-                            str(folder / f"cv_{timestamp}.html"),
-                            str(folder / f"cv_{timestamp}.pdf"),
-                        )
-    except Exception as exc:
-        logger.warning(f"Error extracting paths for job {job_id}: {exc}")
+    if _folder_index_cache and _folder_index_cache[0] == mtime_ns:
+        return _folder_index_cache[1]
 
-    return ("", "", "")
+    folder_index = _build_folder_index()
+    _folder_index_cache = (mtime_ns, folder_index)
+    return folder_index
+
+
+def _matching_folders(job_id: str, folder_index: dict[str, Path]) -> list[Path]:
+    """Return the indexed job folders whose name contains the job ID."""
+    normalized_job_id = _norm(job_id)
+    return [
+        folder for name, folder in folder_index.items() if normalized_job_id in name
+    ]
 
 
-def _extract_doc_paths(response_data: dict, job_id: str, doc_type: str) -> tuple[str, str, str]:
-    """Extract document paths (cover letter or supplemental) from response.
+def _paths_from_builder(
+    response_data: dict, prefix: str
+) -> tuple[str, str, str] | None:
+    """Build artifact paths from the timestamp and folder a builder returned.
+
+    Args:
+        response_data: Service response data
+        prefix: Artifact file name prefix ("cv", "cover" or "supplemental")
+
+    Returns:
+        Tuple of (markdown_path, html_path, pdf_path), or None if the builder
+        did not return its timestamp and folder
+    """
+    timestamp = response_data.get("timestamp")
+    job_folder = response_data.get("job_folder")
+    if not timestamp or not job_folder:
+        return None
+
+    folder = _jobsearch_home() / "jobs" / job_folder
+    return (
+        str(folder / f"{prefix}_{timestamp}.md"),
+        str(folder / f"{prefix}_{timestamp}.html"),
+        str(folder / f"{prefix}_{timestamp}.pdf"),
+    )
+
+
+def _pdf_timestamp(pdf_path: str) -> str | None:
+    """Extract the timestamp from a generated PDF path.
+
+    Generated PDFs are named ``{prefix}_YYYYMMDDTHHMMSSZ.pdf``, so the
+    timestamp is sliced from the end of the path when it has that shape,
+    falling back to a regex search otherwise.
+
+    Args:
+        pdf_path: PDF path returned by a builder
+
+    Returns:
+        Timestamp string, or None if the path contains none
+    """
+    if len(pdf_path) > 21 and pdf_path.endswith(".pdf") and pdf_path[-21] == "_":
+        timestamp = pdf_path[-20:-4]
+        if (
+            timestamp[8] == "T"
+            and timestamp[15] == "Z"
+            and timestamp[:8].isdigit()
+            and timestamp[9:15].isdigit()
+        ):
+            return timestamp
+    match = _TS_RE.search(pdf_path)
+    return match.group(1) if match else None
+
+
+def _latest_markdown(folder: Path, prefix: str) -> str | None:
+    """Return the name of the most recently modified ``{prefix}_*.md`` file.
+
+    Uses a single scandir pass so each candidate is stat'ed at most once.
+
+    Args:
+        folder: Job folder to search
+        prefix: Artifact file name prefix
+
+    Returns:
+        File name, or None if the folder has no matching file
+    """
+    name_prefix = f"{prefix}_"
+    latest_name = None
+    latest_mtime = -1.0
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(name_prefix) and name.endswith(".md"):
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_name, latest_mtime = name, mtime
+    return latest_name
+
+
+def _extract_artifact_paths(
+    response_data: dict, job_id: str, prefix: str, folder_index: dict[str, Path]
+) -> tuple[str, str, str]:
+    """Extract artifact paths (CV, cover letter or supplemental) from response.
 
     Args:
         response_data: Service response data
         job_id: Job ID
-        doc_type: "cover" or "supplemental"
+        prefix: Artifact file name prefix ("cv", "cover" or "supplemental")
+        folder_index: Job folder index from _build_folder_index
 
     Returns:
         Tuple of (markdown_path, html_path, pdf_path)
     """
-    jobsearch_home = _jobsearch_home()
+    paths = _paths_from_builder(response_data, prefix)
+    if paths is not None:
+        return paths
 
+    # Older builders: find job folder
     try:
-        normalized_job_id = job_id.replace("_", "").replace(",", "").lower()
-
-        for folder in (jobsearch_home / "jobs").iterdir():
-            if folder.is_dir():
-                normalized_folder = folder.name.replace("_", "").replace(",", "").lower()
-                if normalized_job_id in normalized_folder:
-                    pdf_path = response_data.get("pdf_path", "")
-
-                    if pdf_path and Path(pdf_path).exists():
-                        timestamp_match = re.search(r"_(\d{8}T\d{6}Z)", pdf_path)
-                        if timestamp_match:
-                            timestamp = timestamp_match.group(1)
-                            return (
-                                str(folder / f"{doc_type}_{timestamp}.md"),
-                                str(folder / f"{doc_type}_{timestamp}.html"),
-                                pdf_path,
-                            )
+        # The returned PDF does not depend on the folder, so stat it once
+        pdf_path = response_data.get("pdf_path", "")
+        pdf_timestamp = None
+        if pdf_path:
+            try:
+                os.stat(pdf_path)
+            except OSError:
+                pass
+            else:
+                pdf_timestamp = _pdf_timestamp(pdf_path)
+
+        for folder in _matching_folders(job_id, folder_index):
+            if pdf_timestamp:
+                return (
+                    str(folder / f"{prefix}_{pdf_timestamp}.md"),
+                    str(folder / f"{prefix}_{pdf_timestamp}.html"),
+                    pdf_path,
+                )
 
-                    # Fallback: find latest files
-                    md_files = list(folder.glob(f"{doc_type}_*.md"))
-                    if md_files:
-                        latest_md = max(md_files, key=lambda p: p.stat().st_mtime)
-                        timestamp = latest_md.stem.split("_")[-1]
-                        return (
-                            str(latest_md),
-                            str(folder / f"{doc_type}_{timestamp}.html"),
-                            str(folder / f"{doc_type}_{timestamp}.pdf"),
-                        )
+            # Fallback: find latest files
+            latest_md = _latest_markdown(folder, prefix)
+            if latest_md:
+                timestamp = latest_md[:-3].split("_")[-1]
+                return (
+                    str(folder / latest_md),
+                    str(folder / f"{prefix}_{timestamp}.html"),
+                    str(folder / f"{prefix}_{timestamp}.pdf"),
+                )
     except Exception as exc:
-        logger.warning(f"Error extracting {doc_type} paths for job {job_id}: {exc}")
+        logger.warning(f"Error extracting {prefix} paths for job {job_id}: {exc}")
 
     return ("", "", "")
 
 
+class _DashboardCache(NamedTuple):
+    """Parsed dashboard and its job index, keyed by the file's stat."""
+
+    mtime_ns: int
+    size: int
+    data: dict
+    index: dict[str, dict]
+
+
+def _cache_dashboard(dashboard_data: dict, file_stat: os.stat_result) -> None:
+    """Remember the parsed dashboard for the file version described by file_stat."""
+    global _dashboard_cache
+    _dashboard_cache = _DashboardCache(
+        mtime_ns=file_stat.st_mtime_ns,
+        size=file_stat.st_size,
+        data=dashboard_data,
+        index={job["job_id"]: job for job in dashboard_data.get("jobs", [])},
+    )
+
+
 def _load_dashboard() -> dict:
-    """Load dashboard from file."""
+    """Load dashboard from file, re-parsing only when the file has changed."""
     dashboard_path = _jobsearch_home() / "review_dashboard.json"
-    if not dashboard_path.exists():
+    try:
+        file_stat = dashboard_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="No dashboard found. Run /prepare first.")
-    return json.loads(dashboard_path.read_text())
+
+    cache = _dashboard_cache
+    if (
+        cache
+        and cache.mtime_ns == file_stat.st_mtime_ns
+        and cache.size == file_stat.st_size
+    ):
+        return cache.data
+
+    dashboard_data = orjson.loads(dashboard_path.read_bytes())
+    _cache_dashboard(dashboard_data, file_stat)
+    return dashboard_data
+
+
+def _load_dashboard_job(job_id: str) -> dict:
+    """Look up a job in the dashboard by ID.
+
+    Args:
+        job_id: Job ID to find
+
+    Returns:
+        The job's entry in the cached dashboard data
+
+    Raises:
+        HTTPException: If there is no dashboard or the job is not in it
+    """
+    _load_dashboard()
+    job_data = _dashboard_cache.index.get(job_id)
+    if job_data is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job_data
 
 
 def _save_dashboard(dashboard_data: dict) -> None:
-    """Save dashboard to file."""
+    """Save dashboard to file.
+
+    The dashboard is written to a temporary sibling and moved into place,
+    so a crash mid-write never leaves a truncated dashboard behind.
+    """
+    global _dashboard_cache
     dashboard_path = _jobsearch_home() / "review_dashboard.json"
-    dashboard_path.write_text(json.dumps(dashboard_data, indent=2))
+    tmp_path = dashboard_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_bytes(orjson.dumps(dashboard_data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, dashboard_path)
+    except OSError:
+        # The cached data may hold edits that never reached the file
+        _dashboard_cache = None
+        raise
+    _cache_dashboard(dashboard_data, dashboard_path.stat())
+
+
+async def _post(url: str, **kwargs) -> httpx.Response:
+    """POST to a downstream service, waiting for an in-flight slot first."""
+    async with _inflight:
+        return await _client.post(url, **kwargs)
+
+
+async def _post_once(
+    calls: dict[tuple[str, str], asyncio.Task], url: str, job_id: str, payload: dict
+) -> httpx.Response:
+    """POST a builder request once per job within a single /prepare call.
+
+    Duplicate requests for the same builder URL and job share the first
+    request's response instead of repeating the LLM generation.
+
+    Args:
+        calls: Request-scoped map of (url, job_id) to in-flight request
+        url: Builder endpoint URL
+        job_id: Job ID the document is generated for
+        payload: JSON request body
+
+    Returns:
+        Builder response
+    """
+    key = (url, job_id)
+    task = calls.get(key)
+    if task is None:
+        task = calls[key] = asyncio.create_task(
+            _post(url, json=payload, timeout=120.0)
+        )
+    return await asyncio.shield(task)
+
+
+class _PrepTask(NamedTuple):
+    """A ranked job selected for preparation, read once from the ranker response."""
+
+    job_id: str
+    title: str
+    company: str
+    location: str
+    apply_url: str
+    fit_score: int
+
+    @classmethod
+    def from_ranked_job(cls, ranked_job: dict) -> _PrepTask:
+        job = ranked_job["job"]
+        return cls(
+            job_id=job["id"],
+            title=job["title"],
+            company=job["company"],
+            location=job["location"],
+            apply_url=job["apply_url"],
+            fit_score=ranked_job["fit_score"]["score"],
+        )
+
+
+async def _prepare_job(
+    task: _PrepTask,
+    request: PrepareRequest,
+    folder_index: dict[str, Path],
+    builder_calls: dict[tuple[str, str], asyncio.Task],
+) -> JobPreparation:
+    """Generate the CV, cover letter and supplementals for one ranked job.
+
+    The documents are generated concurrently. When both a cover letter and
+    supplementals are requested, they come from one /docs/bundle call.
+    Failures are logged and leave the corresponding paths empty.
+
+    Args:
+        task: Job to prepare
+        request: Preparation options
+        folder_index: Job folder index from _build_folder_index
+        builder_calls: Request-scoped builder calls shared by _post_once
+
+    Returns:
+        JobPreparation with the generated artifact paths
+    """
+    job_id = task.job_id
+    job_prep = JobPreparation(
+        job_id=job_id,
+        job_title=task.title,
+        company=task.company,
+        location=task.location,
+        apply_url=task.apply_url,
+        fit_score=task.fit_score,
+    )
+
+    # Generate tailored CV
+    async def generate_cv() -> None:
+        try:
+            logger.info(f"Tailoring CV for job {job_id}")
+            cv_response = await _post_once(
+                builder_calls,
+                f"{_CV_BUILDER_URL}/tailor-cv",
+                job_id,
+                {"job_id": job_id},
+            )
+
+            if cv_response.status_code == 200:
+                cv_data = _json(cv_response)
+                md_path, html_path, pdf_path = _extract_artifact_paths(
+                    cv_data, job_id, "cv", folder_index
+                )
+                job_prep.cv_path = md_path
+                job_prep.cv_html_path = html_path
+                job_prep.cv_pdf_path = pdf_path
+
+                logger.info(f"CV generated: {pdf_path}")
+            else:
+                logger.warning(
+                    f"CV generation failed: "
+                    f"{cv_response.status_code} - {cv_response.text}"
+                )
+        except Exception as exc:
+            logger.error(f"Error generating CV for {job_id}: {exc}")
+
+    def apply_cover_letter(cover_data: dict) -> None:
+        md_path, html_path, pdf_path = _extract_artifact_paths(
+            cover_data, job_id, "cover", folder_index
+        )
+        job_prep.cover_letter_path = md_path
+        job_prep.cover_letter_html_path = html_path
+        job_prep.cover_letter_pdf_path = pdf_path
+
+        logger.info(f"Cover letter generated: {pdf_path}")
+
+    def apply_supplementals(supp_data: dict) -> None:
+        md_path, html_path, pdf_path = _extract_artifact_paths(
+            supp_data, job_id, "supplemental", folder_index
+        )
+        job_prep.supplemental_path = md_path
+        job_prep.supplemental_html_path = html_path
+        job_prep.supplemental_pdf_path = pdf_path
+
+        logger.info(f"Supplemental documents generated: {pdf_path}")
+
+    # Generate cover letter
+    async def generate_cover_letter() -> None:
+        try:
+            logger.info(f"Generating cover letter for job {job_id}")
+            cover_response = await _post_once(
+                builder_calls,
+                f"{_DOC_BUILDER_URL}/cover-letter",
+                job_id,
+                {"job_id": job_id, "tone": request.cover_letter_tone},
+            )
+
+            if cover_response.status_code == 200:
+                apply_cover_letter(_json(cover_response))
+            else:
+                logger.warning(
+                    f"Cover letter generation failed: "
+                    f"{cover_response.status_code} - {cover_response.text}"
+                )
+        except Exception as exc:
+            logger.error(f"Error generating cover letter for {job_id}: {exc}")
+
+    # Generate supplementals
+    async def generate_supplementals() -> None:
+        try:
+            logger.info(f"Generating supplemental documents for job {job_id}")
+            supp_response = await _post_once(
+                builder_calls,
+                f"{_DOC_BUILDER_URL}/supplementals",
+                job_id,
+                {
+                    "job_id": job_id,
+                    "questions": request.supplemental_questions,
+                },
+            )
+
+            if supp_response.status_code == 200:
+                apply_supplementals(_json(supp_response))
+            else:
+                logger.warning(
+                    f"Supplemental generation failed: "
+                    f"{supp_response.status_code} - {supp_response.text}"
+                )
+        except Exception as exc:
+            logger.error(f"Error generating supplementals for {job_id}: {exc}")
+
+    # Generate cover letter and supplementals in one doc builder call
+    async def generate_doc_bundle() -> None:
+        try:
+            logger.info(
+                f"Generating cover letter and supplemental documents for job {job_id}"
+            )
+            bundle_response = await _post_once(
+                builder_calls,
+                f"{_DOC_BUILDER_URL}/docs/bundle",
+                job_id,
+                {
+                    "job_id": job_id,
+                    "cover": {"tone": request.cover_letter_tone},
+                    "supplemental": {"questions": request.supplemental_questions},
+                },
+            )
+
+            if bundle_response.status_code == 404:
+                # Doc builder predates /docs/bundle, use the separate endpoints
+                await asyncio.gather(generate_cover_letter(), generate_supplementals())
+                return
+            if bundle_response.status_code != 200:
+                logger.warning(
+                    f"Document generation failed: "
+                    f"{bundle_response.status_code} - {bundle_response.text}"
+                )
+                return
+
+            bundle_data = _json(bundle_response)
+            if bundle_data.get("cover"):
+                apply_cover_letter(bundle_data["cover"])
+            else:
+                logger.warning(
+                    "Cover letter generation failed: "
+                    f"{bundle_data.get('cover_error', '')}"
+                )
+            if bundle_data.get("supplemental"):
+                apply_supplementals(bundle_data["supplemental"])
+            else:
+                logger.warning(
+                    "Supplemental generation failed: "
+                    f"{bundle_data.get('supplemental_error', '')}"
+                )
+        except Exception as exc:
+            logger.error(f"Error generating documents for {job_id}: {exc}")
+
+    generate_cover = request.generate_cover_letter
+    generate_supp = request.generate_supplementals and bool(
+        request.supplemental_questions
+    )
+
+    generations = [generate_cv()]
+    if generate_cover and generate_supp:
+        generations.append(generate_doc_bundle())
+    elif generate_cover:
+        generations.append(generate_cover_letter())
+    elif generate_supp:
+        generations.append(generate_supplementals())
+    await asyncio.gather(*generations)
+
+    return job_prep
+
+
+# Generated PDFs and HTML under JOBSEARCH_HOME, linked from the review page.
+# StaticFiles rejects paths that escape the directory. The directory is
+# created on startup, so importing this module does not touch the filesystem.
+app.mount(
+    "/files", StaticFiles(directory=_jobsearch_home(), check_dir=False), name="files"
+)
+
+
+@app.on_event("startup")
+async def _create_jobsearch_home() -> None:
+    """Create JOBSEARCH_HOME so /files can serve from it."""
+    os.makedirs(_jobsearch_home(), exist_ok=True)
+
+
+@app.on_event("startup")
+async def _start_audit_worker() -> None:
+    """Start batching audit entries in the background."""
+    start_audit_worker()
+
+
+@app.on_event("shutdown")
+async def _close_http_clients() -> None:
+    """Close pooled HTTP connections on shutdown."""
+    await _client.aclose()
+    await close_audit_client()
+
+
+@app.on_event("shutdown")
+async def _shutdown_browser() -> None:
+    """Close the shared Playwright browser on shutdown."""
+    await _close_browser()
 
 
 @app.get("/healthz")
@@ -199,6 +699,19 @@ async def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.post("/profile/invalidate")
+async def invalidate_profile() -> dict[str, str]:
+    """Drop the cached profile so the next request fetches it from storage.
+
+    Returns:
+        Success message
+    """
+    global _profile_cache
+    _profile_cache = None
+    logger.info("Profile cache invalidated")
+    return {"status": "invalidated"}
+
+
 @app.post("/prepare", response_model=PrepareResponse)
 async def prepare_applications(request: PrepareRequest) -> PrepareResponse:
     """Prepare application materials for top matching jobs.
@@ -220,7 +733,6 @@ async def prepare_applications(request: PrepareRequest) -> PrepareResponse:
     logger.info("Loaded profile")
 
     # Step 2: Search for jobs
-    job_finder_url = _job_finder_url()
     search_payload = {
         "titles": request.titles,
         "locations": request.locations,
@@ -228,278 +740,209 @@ async def prepare_applications(request: PrepareRequest) -> PrepareResponse:
         "salary_min": request.salary_min,
     }
 
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        logger.info(f"Searching jobs at {job_finder_url}/search")
-        search_response = await client.post(
-            f"{job_finder_url}/search",
-            json=search_payload,
-        )
-
-        if search_response.status_code != 200:
-            raise HTTPException(
-                status_code=search_response.status_code,
-                detail=f"Job search failed: {search_response.text}",
-            )
+    logger.info(f"Searching jobs at {_JOB_FINDER_URL}/search")
+    search_response = await _post(
+        f"{_JOB_FINDER_URL}/search",
+        json=search_payload,
+    )
 
-        search_data = search_response.json()
-        all_jobs = search_data.get("postings", [])
-        logger.info(f"Found {len(all_jobs)} jobs")
-
-        if not all_jobs:
-            logger.warning("No jobs found, returning empty response")
-            return PrepareResponse(
-                dashboard_path="",
-                jobs_prepared=0,
-                jobs=[],
-                total_violations=0,
-            )
+    if search_response.status_code != 200:
+        raise HTTPException(
+            status_code=search_response.status_code,
+            detail=f"Job search failed: {search_response.text}",
+        )
 
-        # Step 3: Rank jobs
-        job_ranker_url = _job_ranker_url()
-        rank_payload = {
-            "profile": profile,
-            "jobs": all_jobs,
-        }
+    search_data = _json(search_response)
+    all_jobs = search_data.get("postings", [])
+    logger.info(f"Found {len(all_jobs)} jobs")
 
-        logger.info(f"Ranking {len(all_jobs)} jobs at {job_ranker_url}/rank")
-        rank_response = await client.post(
-            f"{job_ranker_url}/rank",
-            json=rank_payload,
+    if not all_jobs:
+        logger.warning("No jobs found, returning empty response")
+        return PrepareResponse(
+            dashboard_path="",
+            jobs_prepared=0,
+            jobs=[],
+            total_violations=0,
         )
 
-        if rank_response.status_code != 200:
-            raise HTTPException(
-                status_code=rank_response.status_code,
-                detail=f"Job ranking failed: {rank_response.text}",
-            )
-
-        rank_data = rank_response.json()
-        ranked_jobs = rank_data.get("ranked_jobs", [])
-        logger.info(f"Ranked {len(ranked_jobs)} jobs")
+    # Step 3: Rank jobs
+    rank_payload = {
+        "profile": {
+            field: profile[field]
+            for field in _RANKER_PROFILE_FIELDS
+            if field in profile
+        },
+        "jobs": all_jobs,
+        "top_n": request.top_n,
+    }
 
-        # Step 4: Select top N jobs
-        top_jobs = ranked_jobs[: request.top_n]
-        logger.info(f"Selected top {len(top_jobs)} jobs for preparation")
+    logger.info(f"Ranking {len(all_jobs)} jobs at {_JOB_RANKER_URL}/rank")
+    rank_response = await _post(
+        f"{_JOB_RANKER_URL}/rank",
+        json=rank_payload,
+    )
 
-        # Step 5: Prepare materials for each job
-        prepared_jobs: list[JobPreparation] = []
-        all_artifact_paths: list[str] = []
+    if rank_response.status_code != 200:
+        raise HTTPException(
+            status_code=rank_response.status_code,
+            detail=f"Job ranking failed: {rank_response.text}",
+        )
 
-        cv_builder_url = _cv_builder_url()
-        doc_builder_url = _doc_builder_url()
+    rank_data = _json(rank_response)
+    ranked_jobs = rank_data.get("ranked_jobs", [])
+    logger.info(f"Ranked {len(ranked_jobs)} jobs")
 
-        for ranked_job in top_jobs:
-            job = ranked_job["job"]
-            fit_score = ranked_job["fit_score"]
+    # Step 4: Select top N jobs
+    top_jobs = [_PrepTask.from_ranked_job(rj) for rj in ranked_jobs[: request.top_n]]
+    logger.info(
+        f"Selected top {len(top_jobs)} jobs for preparation: "
+        + "; ".join(
+            f"{t.title} at {t.company} (score: {t.fit_score})" for t in top_jobs
+        )
+    )
 
-            job_id = job["id"]
-            logger.info(f"Preparing materials for {job['title']} at {job['company']} (score: {fit_score['score']})")
+    # Step 5: Prepare materials for each job, a few jobs at a time
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PREPARATIONS)
+    folder_index = await asyncio.to_thread(_cached_folder_index)
+    builder_calls: dict[tuple[str, str], asyncio.Task] = {}
+
+    async def prepare(task: _PrepTask) -> JobPreparation:
+        async with semaphore:
+            return await _prepare_job(task, request, folder_index, builder_calls)
+
+    prepared_jobs = list(await asyncio.gather(*(prepare(task) for task in top_jobs)))
+    all_artifact_paths = [
+        path
+        for job_prep in prepared_jobs
+        for path in (
+            job_prep.cv_html_path,
+            job_prep.cover_letter_html_path,
+            job_prep.supplemental_html_path,
+        )
+        if path
+    ]
+    logger.info(
+        f"Prepared materials for {len(prepared_jobs)} jobs, "
+        f"{len(all_artifact_paths)} HTML artifacts generated"
+    )
 
-            job_prep = JobPreparation(
-                job_id=job_id,
-                job_title=job["title"],
-                company=job["company"],
-                location=job["location"],
-                apply_url=job["apply_url"],
-                fit_score=fit_score["score"],
-            )
+    # Step 6: Run validation across all artifacts
+    logger.info(f"Running validation on {len(all_artifact_paths)} artifacts")
+    total_violations = 0
+    jobsearch_home = _jobsearch_home()
 
-            # Generate tailored CV
-            try:
-                logger.info(f"Tailoring CV for job {job_id}")
-                cv_response = await client.post(
-                    f"{cv_builder_url}/tailor-cv",
-                    json={"job_id": job_id},
-                    timeout=120.0,
+    if all_artifact_paths:
+        try:
+            # Convert absolute paths to relative paths for validation
+            home_prefix = str(jobsearch_home) + os.sep
+            relative_paths = []
+            for abs_path in all_artifact_paths:
+                rel_path = abs_path.removeprefix(home_prefix)
+                if rel_path != abs_path:
+                    relative_paths.append(rel_path)
+                else:
+                    logger.warning(f"Path {abs_path} not relative to {jobsearch_home}")
+
+            if relative_paths:
+                validate_response = await _post(
+                    f"{_DOC_BUILDER_URL}/validate",
+                    json={
+                        "artifact_paths": relative_paths,
+                        # Don't fail, just collect violations
+                        "fail_on_violations": False,
+                    },
+                    timeout=60.0,
                 )
 
-                if cv_response.status_code == 200:
-                    cv_data = cv_response.json()
-                    md_path, html_path, pdf_path = _extract_paths_from_response(cv_data, job_id)
-                    job_prep.cv_path = md_path
-                    job_prep.cv_html_path = html_path
-                    job_prep.cv_pdf_path = pdf_path
-
-                    if html_path:
-                        all_artifact_paths.append(html_path)
+                if validate_response.status_code == 200:
+                    validate_data = _json(validate_response)
+                    violations = validate_data.get("violations", [])
+                    total_violations = len(violations)
+
+                    # Map violations to jobs through a path index. Artifacts
+                    # normally match a path exactly, otherwise fall back to a
+                    # substring search.
+                    path_to_job: dict[str, JobPreparation] = {}
+                    for job_prep in prepared_jobs:
+                        for path in (
+                            job_prep.cv_html_path,
+                            job_prep.cover_letter_html_path,
+                            job_prep.supplemental_html_path,
+                        ):
+                            if path:
+                                path_to_job[path] = job_prep
+
+                    violation_counts: Counter[int] = Counter()
+                    for v in violations:
+                        artifact = v.get("artifact", "")
+                        job_prep = path_to_job.get(artifact) or next(
+                            (
+                                jp
+                                for path, jp in path_to_job.items()
+                                if path in artifact
+                            ),
+                            None,
+                        )
+                        if job_prep is not None:
+                            violation_counts[id(job_prep)] += 1
 
-                    logger.info(f"CV generated: {pdf_path}")
-                else:
-                    logger.warning(f"CV generation failed: {cv_response.status_code} - {cv_response.text}")
-            except Exception as exc:
-                logger.error(f"Error generating CV for {job_id}: {exc}")
+                    for job_prep in prepared_jobs:
+                        job_violations = violation_counts[id(job_prep)]
+                        job_prep.validation_violations = job_violations
+                        job_prep.validation_passed = job_violations == 0
 
-            # Generate cover letter
-            if request.generate_cover_letter:
-                try:
-                    logger.info(f"Generating cover letter for job {job_id}")
-                    cover_response = await client.post(
-                        f"{doc_builder_url}/cover-letter",
-                        json={"job_id": job_id, "tone": request.cover_letter_tone},
-                        timeout=120.0,
+                    logger.info(
+                        f"Validation complete: {total_violations} total violations"
                     )
-
-                    if cover_response.status_code == 200:
-                        cover_data = cover_response.json()
-                        md_path, html_path, pdf_path = _extract_doc_paths(cover_data, job_id, "cover")
-                        job_prep.cover_letter_path = md_path
-                        job_prep.cover_letter_html_path = html_path
-                        job_prep.cover_letter_pdf_path = pdf_path
-
-                        if html_path:
-                            all_artifact_paths.append(html_path)
-
-                        logger.info(f"Cover letter generated: {pdf_path}")
-                    else:
-                        logger.warning(f"Cover letter generation failed: {cover_response.status_code} - {cover_response.text}")
-                except Exception as exc:
-                    logger.error(f"Error generating cover letter for {job_id}: {exc}")
-
-            # Generate supplementals
-            if request.generate_supplementals and request.supplemental_questions:
-                try:
-                    logger.info(f"Generating supplemental documents for job {job_id}")
-                    supp_response = await client.post(
-                        f"{doc_builder_url}/supplementals",
-                        json={
-                            "job_id": job_id,
-                            "questions": request.supplemental_questions,
-                        },
-                        timeout=120.0,
+                else:
+                    logger.warning(
+                        f"Validation failed: {validate_response.status_code}"
                     )
+        except Exception as exc:
+            logger.error(f"Error running validation: {exc}")
 
-                    if supp_response.status_code == 200:
-                        supp_data = supp_response.json()
-                        md_path, html_path, pdf_path = _extract_doc_paths(supp_data, job_id, "supplemental")
-                        job_prep.supplemental_path = md_path
-                        job_prep.supplemental_html_path = html_path
-                        job_prep.supplemental_pdf_path = pdf_path
-
-                        if html_path:
-                            all_artifact_paths.append(html_path)
-
-                        logger.info(f"Supplemental documents generated: {pdf_path}")
-                    else:
-                        logger.warning(f"Supplemental generation failed: {supp_response.status_code} - {supp_response.text}")
-                except Exception as exc:
-                    logger.error(f"Error generating supplementals for {job_id}: {exc}")
-
-            prepared_jobs.append(job_prep)
-
-        # Step 6: Run validation across all artifacts
-        logger.info(f"Running validation on {len(all_artifact_paths)} artifacts")
-        total_violations = 0
-        jobsearch_home = _jobsearch_home()
-
-        if all_artifact_paths:
-            try:
-                # Convert absolute paths to relative paths for validation
-                relative_paths = []
-                for abs_path in all_artifact_paths:
-                    try:
-                        rel_path = Path(abs_path).relative_to(jobsearch_home)
-                        relative_paths.append(str(rel_path))
-                    except ValueError:
-                        logger.warning(f"Path {abs_path} not relative to {jobsearch_home}")
-
-                if relative_paths:
-                    validate_response = await client.post(
-                        f"{doc_builder_url}/validate",
-                        json={
-                            "artifact_paths": relative_paths,
-                            "fail_on_violations": False,  # Don't fail, just collect violations
-                        },
-                        timeout=60.0,
-                    )
+    # Step 7: Create dashboard JSON
+    dashboard_data = {
+        "jobs_prepared": len(prepared_jobs),
+        "total_violations": total_violations,
+        "jobs": [job.model_dump(mode="json") for job in prepared_jobs],
+    }
 
-                    if validate_response.status_code == 200:
-                        validate_data = validate_response.json()
-                        violations = validate_data.get("violations", [])
-                        total_violations = len(violations)
-
-                        # Map violations to jobs
-                        for job_prep in prepared_jobs:
-                            job_violations = [
-                                v for v in violations
-                                if any(
-                                    path in v.get("artifact", "")
-                                    for path in [
-                                        job_prep.cv_html_path,
-                                        job_prep.cover_letter_html_path,
-                                        job_prep.supplemental_html_path,
-                                    ]
-                                    if path
-                                )
-                            ]
-                            job_prep.validation_violations = len(job_violations)
-                            job_prep.validation_passed = len(job_violations) == 0
-
-                        logger.info(f"Validation complete: {total_violations} total violations")
-                    else:
-                        logger.warning(f"Validation failed: {validate_response.status_code}")
-            except Exception as exc:
-                logger.error(f"Error running validation: {exc}")
+    dashboard_path = jobsearch_home / "review_dashboard.json"
+    async with _dashboard_lock:
+        await asyncio.to_thread(_save_dashboard, dashboard_data)
+    logger.info(f"Dashboard saved to {dashboard_path}")
+
+    # Log audit entry for prepare operation
+    artifact_paths = []
+    for job_prep in prepared_jobs:
+        if job_prep.cv_pdf_path:
+            artifact_paths.append((job_prep.cv_pdf_path, "cv"))
+        if job_prep.cover_letter_pdf_path:
+            artifact_paths.append((job_prep.cover_letter_pdf_path, "cover_letter"))
+        if job_prep.supplemental_pdf_path:
+            artifact_paths.append((job_prep.supplemental_pdf_path, "supplemental"))
+    artifacts = await create_artifact_records(artifact_paths)
 
-        # Step 7: Create dashboard JSON
-        dashboard_data = {
+    await log_audit_entry(
+        run_id=audit_run_id,
+        operation="PREPARE",
+        timestamp_start=prepare_start,
+        timestamp_end=datetime.now().isoformat(),
+        status="SUCCESS",
+        artifacts=artifacts,
+        metadata={
             "jobs_prepared": len(prepared_jobs),
             "total_violations": total_violations,
-            "jobs": [
-                {
-                    "job_id": job.job_id,
-                    "job_title": job.job_title,
-                    "company": job.company,
-                    "location": job.location,
-                    "apply_url": job.apply_url,
-                    "fit_score": job.fit_score,
-                    "cv_path": job.cv_path,
-                    "cv_html_path": job.cv_html_path,
-                    "cv_pdf_path": job.cv_pdf_path,
-                    "cover_letter_path": job.cover_letter_path,
-                    "cover_letter_html_path": job.cover_letter_html_path,
-                    "cover_letter_pdf_path": job.cover_letter_pdf_path,
-                    "supplemental_path": job.supplemental_path,
-                    "supplemental_html_path": job.supplemental_html_path,
-                    "supplemental_pdf_path": job.supplemental_pdf_path,
-                    "validation_passed": job.validation_passed,
-                    "validation_violations": job.validation_violations,
-                    "status": job.status.value,
-                    "rejection_reason": job.rejection_reason,
-                }
-                for job in prepared_jobs
-            ],
-        }
-
-        dashboard_path = jobsearch_home / "review_dashboard.json"
-        dashboard_path.write_text(json.dumps(dashboard_data, indent=2))
-        logger.info(f"Dashboard saved to {dashboard_path}")
-
-        # Log audit entry for prepare operation
-        artifacts = []
-        for job_prep in prepared_jobs:
-            if job_prep.cv_pdf_path:
-                artifacts.append(create_artifact_record(job_prep.cv_pdf_path, "cv"))
-            if job_prep.cover_letter_pdf_path:
-                artifacts.append(create_artifact_record(job_prep.cover_letter_pdf_path, "cover_letter"))
-            if job_prep.supplemental_pdf_path:
-                artifacts.append(create_artifact_record(job_prep.supplemental_pdf_path, "supplemental"))
-
-        await log_audit_entry(
-            run_id=audit_run_id,
-            operation="PREPARE",
-            timestamp_start=prepare_start,
-            timestamp_end=datetime.now().isoformat(),
-            status="SUCCESS",
-            artifacts=artifacts,
-            metadata={"jobs_prepared": len(prepared_jobs), "total_violations": total_violations},
-        )
+        },
+    )
 
-        return PrepareResponse(
-            dashboard_path=str(dashboard_path),
-            jobs_prepared=len(prepared_jobs),
-            jobs=prepared_jobs,
-            total_violations=total_violations,
-        )
+    return PrepareResponse(
+        dashboard_path=str(dashboard_path),
+        jobs_prepared=len(prepared_jobs),
+        jobs=prepared_jobs,
+        total_violations=total_violations,
+    )
 
 
 @app.get("/review", response_model=ReviewResponse)
@@ -509,7 +952,7 @@ async def get_review_dashboard() -> ReviewResponse:
     Returns:
         ReviewResponse with all jobs and their status
     """
-    dashboard_data = _load_dashboard()
+    dashboard_data = await asyncio.to_thread(_load_dashboard)
 
     jobs = []
     for job_data in dashboard_data.get("jobs", []):
@@ -554,21 +997,13 @@ async def approve_application(request: ApproveRequest) -> dict[str, str]:
     Returns:
         Success message
     """
-    dashboard_data = _load_dashboard()
-
-    job_found = False
-    for job_data in dashboard_data.get("jobs", []):
-        if job_data["job_id"] == request.job_id:
-            job_data["status"] = ApplicationStatus.READY_TO_APPLY.value
-            job_data["rejection_reason"] = ""
-            job_found = True
-            logger.info(f"Approved job {request.job_id}")
-            break
-
-    if not job_found:
-        raise HTTPException(status_code=404, detail=f"Job {request.job_id} not found")
+    async with _dashboard_lock:
+        job_data = await asyncio.to_thread(_load_dashboard_job, request.job_id)
+        job_data["status"] = ApplicationStatus.READY_TO_APPLY.value
+        job_data["rejection_reason"] = ""
+        await asyncio.to_thread(_save_dashboard, _dashboard_cache.data)
 
-    _save_dashboard(dashboard_data)
+    logger.info(f"Approved job {request.job_id}")
 
     return {"status": "approved", "job_id": request.job_id}
 
@@ -583,48 +1018,290 @@ async def reject_application(request: RejectRequest) -> dict[str, str]:
     Returns:
         Success message
     """
-    dashboard_data = _load_dashboard()
+    async with _dashboard_lock:
+        job_data = await asyncio.to_thread(_load_dashboard_job, request.job_id)
+        job_data["status"] = ApplicationStatus.REJECTED.value
+        job_data["rejection_reason"] = request.reason
+        await asyncio.to_thread(_save_dashboard, _dashboard_cache.data)
 
-    job_found = False
-    for job_data in dashboard_data.get("jobs", []):
-        if job_data["job_id"] == request.job_id:
-            job_data["status"] = ApplicationStatus.REJECTED.value
-            job_data["rejection_reason"] = request.reason
-            job_found = True
-            logger.info(f"Rejected job {request.job_id}: {request.reason}")
-            break
+    logger.info(f"Rejected job {request.job_id}: {request.reason}")
+
+    return {"status": "rejected", "job_id": request.job_id, "reason": request.reason}
 
-    if not job_found:
-        raise HTTPException(status_code=404, detail=f"Job {request.job_id} not found")
 
-    _save_dashboard(dashboard_data)
+# Review dashboard status badge colors
+_STATUS_COLOR = {
+    "PENDING_REVIEW": "#ff9800",
+    "READY_TO_APPLY": "#4caf50",
+    "REJECTED": "#f44336",
+}
+_STATUS_DEFAULT = "#999"
+
+# Static parts of the review dashboard page, shared by every render
+_DASHBOARD_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Job Review Dashboard</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto,
+                'Helvetica Neue', Arial, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        h1 { color: #1976d2; margin-bottom: 10px; }
+        .summary {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .job-card {
+            background: white;
+            padding: 20px;
+            margin-bottom: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .job-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: flex-start;
+            margin-bottom: 15px;
+        }
+        h3 { margin: 0 0 5px 0; color: #333; }
+        .company { color: #666; margin: 0; font-size: 14px; }
+        .status-badge {
+            padding: 6px 12px;
+            border-radius: 4px;
+            color: white;
+            font-size: 12px;
+            font-weight: bold;
+            text-transform: uppercase;
+        }
+        .job-details { margin-bottom: 15px; }
+        .job-details p { margin: 5px 0; font-size: 14px; }
+        .badge {
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 12px;
+            font-weight: bold;
+        }
+        .badge-success { background: #4caf50; color: white; }
+        .badge-error { background: #f44336; color: white; }
+        .job-actions {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding-top: 15px;
+            border-top: 1px solid #eee;
+        }
+        .links a {
+            margin-right: 15px;
+            color: #1976d2;
+            text-decoration: none;
+        }
+        .links a:hover { text-decoration: underline; }
+        .buttons { display: flex; gap: 10px; }
+        .btn {
+            padding: 8px 16px;
+            border: none;
+            border-radius: 4px;
+            cursor: pointer;
+            font-size: 14px;
+            font-weight: 500;
+        }
+        .btn-approve { background: #4caf50; color: white; }
+        .btn-approve:hover { background: #45a049; }
+        .btn-reject { background: #f44336; color: white; }
+        .btn-reject:hover { background: #da190b; }
+        .rejection-reason {
+            color: #d32f2f;
+            background: #ffebee;
+            padding: 10px;
+            border-radius: 4px;
+            margin-top: 10px;
+        }
+        .modal {
+            display: none;
+            position: fixed;
+            z-index: 1000;
+            left: 0;
+            top: 0;
+            width: 100%;
+            height: 100%;
+            background-color: rgba(0,0,0,0.5);
+        }
+        .modal-content {
+            background-color: white;
+            margin: 15% auto;
+            padding: 30px;
+            border-radius: 8px;
+            width: 500px;
+            max-width: 90%;
+        }
+        .modal-content h2 { margin-top: 0; }
+        .modal-content textarea {
+            width: 100%;
+            min-height: 100px;
+            padding: 10px;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            font-family: inherit;
+            font-size: 14px;
+        }
+        .modal-buttons {
+            display: flex;
+            gap: 10px;
+            margin-top: 20px;
+            justify-content: flex-end;
+        }
+        .btn-cancel { background: #999; color: white; }
+        .btn-cancel:hover { background: #777; }
+    </style>
+</head>
+<body>
+    <h1>Job Review Dashboard</h1>
+
+"""
+
+_DASHBOARD_SCRIPT = """
+    <script>
+        const STATUS_COLOR = """ + orjson.dumps(_STATUS_COLOR).decode() + """;
+        let currentJobId = '';
+
+        // The reject modal is only added to the page the first time it is opened
+        const REJECT_MODAL_HTML = `
+            <div id="rejectModal" class="modal">
+                <div class="modal-content">
+                    <h2>Reject Application</h2>
+                    <p id="rejectJobTitle"></p>
+                    <textarea id="rejectReason"
+                        placeholder="Enter rejection reason..."></textarea>
+                    <div class="modal-buttons">
+                        <button onclick="closeRejectModal()"
+                            class="btn btn-cancel">Cancel</button>
+                        <button onclick="submitReject()"
+                            class="btn btn-reject">Reject</button>
+                    </div>
+                </div>
+            </div>`;
 
-    return {"status": "rejected", "job_id": request.job_id, "reason": request.reason}
+        function ensureRejectModal() {
+            if (!document.getElementById('rejectModal')) {
+                document.body.insertAdjacentHTML('beforeend', REJECT_MODAL_HTML);
+            }
+        }
 
+        // One listener handles the buttons of every job card
+        document.body.addEventListener('click', (event) => {
+            const button = event.target.closest('[data-action]');
+            if (!button) return;
+            if (button.dataset.action === 'approve') {
+                approveJob(button.dataset.jobId);
+            } else if (button.dataset.action === 'reject') {
+                showRejectModal(button.dataset.jobId, button.dataset.jobTitle);
+            }
+        });
+
+        // Update a job card in place after the server accepted a review action
+        function updateJobCard(jobId, status, reason) {
+            const card = document.querySelector(
+                `.job-card[data-job-id="${CSS.escape(jobId)}"]`
+            );
+            if (!card) {
+                location.reload();
+                return;
+            }
+            const badge = card.querySelector('.status-badge');
+            badge.textContent = status.replace(/_/g, ' ');
+            badge.style.backgroundColor =
+                STATUS_COLOR[status] || '""" + _STATUS_DEFAULT + """';
+
+            const details = card.querySelector('.job-details');
+            const previous = details.querySelector('.rejection-reason');
+            if (previous) previous.remove();
+            if (reason) {
+                const paragraph = document.createElement('p');
+                paragraph.className = 'rejection-reason';
+                paragraph.innerHTML = '<strong>Reason:</strong> ';
+                paragraph.append(reason);
+                details.append(paragraph);
+            }
+        }
 
-@app.get("/files/{file_path:path}")
-async def serve_file(file_path: str) -> FileResponse:
-    """Serve static files (PDFs, HTML) from JobSearch directory.
+        async function approveJob(jobId) {
+            try {
+                const response = await fetch('/approve', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ job_id: jobId })
+                });
+
+                if (response.ok) {
+                    updateJobCard(jobId, 'READY_TO_APPLY', '');
+                } else {
+                    alert('Failed to approve job');
+                }
+            } catch (error) {
+                alert('Error: ' + error.message);
+            }
+        }
 
-    Args:
-        file_path: Relative path from JOBSEARCH_HOME
+        function showRejectModal(jobId, jobTitle) {
+            ensureRejectModal();
+            currentJobId = jobId;
+            document.getElementById('rejectJobTitle').textContent = 'Job: ' + jobTitle;
+            document.getElementById('rejectModal').style.display = 'block';
+        }
 
-    Returns:
-        File content
-    """
-    jobsearch_home = _jobsearch_home()
-    full_path = jobsearch_home / file_path
+        function closeRejectModal() {
+            document.getElementById('rejectModal').style.display = 'none';
+            document.getElementById('rejectReason').value = '';
+            currentJobId = '';
+        }
+
+        async function submitReject() {
+            const reason = document.getElementById('rejectReason').value.trim();
+            if (!reason) {
+                alert('Please enter a rejection reason');
+                return;
+            }
 
-    if not full_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+            try {
+                const response = await fetch('/reject', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ job_id: currentJobId, reason: reason })
+                });
 
-    # Security check: ensure file is within JOBSEARCH_HOME
-    try:
-        full_path.resolve().relative_to(jobsearch_home.resolve())
-    except ValueError:
-        raise HTTPException(status_code=403, detail="Access denied")
+                if (response.ok) {
+                    updateJobCard(currentJobId, 'REJECTED', reason);
+                    closeRejectModal();
+                } else {
+                    alert('Failed to reject job');
+                }
+            } catch (error) {
+                alert('Error: ' + error.message);
+            }
+        }
 
-    return FileResponse(full_path)
+        // Close modal when clicking outside
+        window.onclick = function(event) {
+            const modal = document.getElementById('rejectModal');
+            if (event.target == modal) {
+                closeRejectModal();
+            }
+        }
+    </script>
+</body>
+</html>
+"""
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -635,7 +1312,7 @@ async def review_ui() -> str:
         HTML page with job review interface
     """
     try:
-        dashboard_data = _load_dashboard()
+        dashboard_data = await asyncio.to_thread(_load_dashboard)
     except HTTPException:
         return """
         <!DOCTYPE html>
@@ -657,30 +1334,41 @@ async def review_ui() -> str:
         </html>
         """
 
-    jobs = dashboard_data.get("jobs", [])
+    global _review_page_cache
+    dashboard_cache = _dashboard_cache
+    if _review_page_cache and _review_page_cache[0] is dashboard_cache:
+        return _review_page_cache[1]
 
-    jobs_html = ""
+    jobs = dashboard_data.get("jobs", [])
+    home = _jobsearch_home()
+
+    parts: list[str] = [
+        _DASHBOARD_HEAD,
+        f"""
+    <div class="summary">
+        <p><strong>Jobs Prepared:</strong> {dashboard_data.get('jobs_prepared', 0)}</p>
+        <p><strong>Total Validation Violations:</strong>
+            {dashboard_data.get('total_violations', 0)}</p>
+    </div>
+""",
+    ]
     for job in jobs:
         status = job.get("status", "PENDING_REVIEW")
-        status_color = {
-            "PENDING_REVIEW": "#ff9800",
-            "READY_TO_APPLY": "#4caf50",
-            "REJECTED": "#f44336",
-        }.get(status, "#999")
+        status_color = _STATUS_COLOR.get(status, _STATUS_DEFAULT)
 
         cv_link = ""
         if job.get("cv_pdf_path"):
-            rel_path = Path(job["cv_pdf_path"]).relative_to(_jobsearch_home())
+            rel_path = Path(job["cv_pdf_path"]).relative_to(home)
             cv_link = f'<a href="/files/{rel_path}" target="_blank">CV PDF</a>'
 
         cover_link = ""
         if job.get("cover_letter_pdf_path"):
-            rel_path = Path(job["cover_letter_pdf_path"]).relative_to(_jobsearch_home())
+            rel_path = Path(job["cover_letter_pdf_path"]).relative_to(home)
             cover_link = f'<a href="/files/{rel_path}" target="_blank">Cover Letter PDF</a>'
 
         supp_link = ""
         if job.get("supplemental_pdf_path"):
-            rel_path = Path(job["supplemental_pdf_path"]).relative_to(_jobsearch_home())
+            rel_path = Path(job["supplemental_pdf_path"]).relative_to(home)
             supp_link = f'<a href="/files/{rel_path}" target="_blank">Supplemental PDF</a>'
 
         validation_badge = (
@@ -691,14 +1379,22 @@ async def review_ui() -> str:
 
         rejection_reason = ""
         if status == "REJECTED" and job.get("rejection_reason"):
-            rejection_reason = f'<p class="rejection-reason"><strong>Reason:</strong> {job["rejection_reason"]}</p>'
+            rejection_reason = (
+                '<p class="rejection-reason"><strong>Reason:</strong> '
+                f'{html.escape(job["rejection_reason"])}</p>'
+            )
 
-        jobs_html += f"""
-        <div class="job-card">
+        job_id = html.escape(job["job_id"])
+        job_title = html.escape(job["job_title"])
+
+        parts.append(f"""
+        <div class="job-card" data-job-id="{job_id}">
             <div class="job-header">
                 <div>
-                    <h3>{job['job_title']}</h3>
-                    <p class="company">{job['company']} • {job['location']}</p>
+                    <h3>{job_title}</h3>
+                    <p class="company">
+                        {html.escape(job['company'])} • {html.escape(job['location'])}
+                    </p>
                 </div>
                 <div class="status-badge" style="background-color: {status_color};">
                     {status.replace('_', ' ')}
@@ -712,237 +1408,25 @@ async def review_ui() -> str:
             <div class="job-actions">
                 <div class="links">
                     {cv_link} {cover_link} {supp_link}
-                    <a href="{job['apply_url']}" target="_blank">Apply URL</a>
+                    <a href="{html.escape(job['apply_url'])}"
+                        target="_blank">Apply URL</a>
                 </div>
                 <div class="buttons">
-                    <button onclick="approveJob('{job['job_id']}')" class="btn btn-approve">Approve</button>
-                    <button onclick="showRejectModal('{job['job_id']}', '{job['job_title']}')" class="btn btn-reject">Reject</button>
-                </div>
-            </div>
-        </div>
-        """
-
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>Job Review Dashboard</title>
-        <style>
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-                max-width: 1200px;
-                margin: 0 auto;
-                padding: 20px;
-                background-color: #f5f5f5;
-            }}
-            h1 {{ color: #1976d2; margin-bottom: 10px; }}
-            .summary {{
-                background: white;
-                padding: 20px;
-                border-radius: 8px;
-                margin-bottom: 20px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }}
-            .job-card {{
-                background: white;
-                padding: 20px;
-                margin-bottom: 20px;
-                border-radius: 8px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }}
-            .job-header {{
-                display: flex;
-                justify-content: space-between;
-                align-items: flex-start;
-                margin-bottom: 15px;
-            }}
-            h3 {{ margin: 0 0 5px 0; color: #333; }}
-            .company {{ color: #666; margin: 0; font-size: 14px; }}
-            .status-badge {{
-                padding: 6px 12px;
-                border-radius: 4px;
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-                text-transform: uppercase;
-            }}
-            .job-details {{ margin-bottom: 15px; }}
-            .job-details p {{ margin: 5px 0; font-size: 14px; }}
-            .badge {{
-                padding: 4px 8px;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: bold;
-            }}
-            .badge-success {{ background: #4caf50; color: white; }}
-            .badge-error {{ background: #f44336; color: white; }}
-            .job-actions {{
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                padding-top: 15px;
-                border-top: 1px solid #eee;
-            }}
-            .links a {{
-                margin-right: 15px;
-                color: #1976d2;
-                text-decoration: none;
-            }}
-            .links a:hover {{ text-decoration: underline; }}
-            .buttons {{ display: flex; gap: 10px; }}
-            .btn {{
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-                cursor: pointer;
-                font-size: 14px;
-                font-weight: 500;
-            }}
-            .btn-approve {{ background: #4caf50; color: white; }}
-            .btn-approve:hover {{ background: #45a049; }}
-            .btn-reject {{ background: #f44336; color: white; }}
-            .btn-reject:hover {{ background: #da190b; }}
-            .rejection-reason {{
-                color: #d32f2f;
-                background: #ffebee;
-                padding: 10px;
-                border-radius: 4px;
-                margin-top: 10px;
-            }}
-            .modal {{
-                display: none;
-                position: fixed;
-                z-index: 1000;
-                left: 0;
-                top: 0;
-                width: 100%;
-                height: 100%;
-                background-color: rgba(0,0,0,0.5);
-            }}
-            .modal-content {{
-                background-color: white;
-                margin: 15% auto;
-                padding: 30px;
-                border-radius: 8px;
-                width: 500px;
-                max-width: 90%;
-            }}
-            .modal-content h2 {{ margin-top: 0; }}
-            .modal-content textarea {{
-                width: 100%;
-                min-height: 100px;
-                padding: 10px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-family: inherit;
-                font-size: 14px;
-            }}
-            .modal-buttons {{
-                display: flex;
-                gap: 10px;
-                margin-top: 20px;
-                justify-content: flex-end;
-            }}
-            .btn-cancel {{ background: #999; color: white; }}
-            .btn-cancel:hover {{ background: #777; }}
-        </style>
-    </head>
-    <body>
-        <h1>Job Review Dashboard</h1>
-
-        <div class="summary">
-            <p><strong>Jobs Prepared:</strong> {dashboard_data.get('jobs_prepared', 0)}</p>
-            <p><strong>Total Validation Violations:</strong> {dashboard_data.get('total_violations', 0)}</p>
-        </div>
-
-        {jobs_html}
-
-        <!-- Reject Modal -->
-        <div id="rejectModal" class="modal">
-            <div class="modal-content">
-                <h2>Reject Application</h2>
-                <p id="rejectJobTitle"></p>
-                <textarea id="rejectReason" placeholder="Enter rejection reason..."></textarea>
-                <div class="modal-buttons">
-                    <button onclick="closeRejectModal()" class="btn btn-cancel">Cancel</button>
-                    <button onclick="submitReject()" class="btn btn-reject">Reject</button>
+                    <button data-action="approve" data-job-id="{job_id}"
+                        class="btn btn-approve">Approve</button>
+                    <button data-action="reject" data-job-id="{job_id}"
+                        data-job-title="{job_title}"
+                        class="btn btn-reject">Reject</button>
                 </div>
             </div>
         </div>
+        """)
 
-        <script>
-            let currentJobId = '';
-
-            async function approveJob(jobId) {{
-                try {{
-                    const response = await fetch('/approve', {{
-                        method: 'POST',
-                        headers: {{ 'Content-Type': 'application/json' }},
-                        body: JSON.stringify({{ job_id: jobId }})
-                    }});
-
-                    if (response.ok) {{
-                        alert('Job approved!');
-                        location.reload();
-                    }} else {{
-                        alert('Failed to approve job');
-                    }}
-                }} catch (error) {{
-                    alert('Error: ' + error.message);
-                }}
-            }}
-
-            function showRejectModal(jobId, jobTitle) {{
-                currentJobId = jobId;
-                document.getElementById('rejectJobTitle').textContent = 'Job: ' + jobTitle;
-                document.getElementById('rejectModal').style.display = 'block';
-            }}
-
-            function closeRejectModal() {{
-                document.getElementById('rejectModal').style.display = 'none';
-                document.getElementById('rejectReason').value = '';
-                currentJobId = '';
-            }}
-
-            async function submitReject() {{
-                const reason = document.getElementById('rejectReason').value.trim();
-                if (!reason) {{
-                    alert('Please enter a rejection reason');
-                    return;
-                }}
-
-                try {{
-                    const response = await fetch('/reject', {{
-                        method: 'POST',
-                        headers: {{ 'Content-Type': 'application/json' }},
-                        body: JSON.stringify({{ job_id: currentJobId, reason: reason }})
-                    }});
-
-                    if (response.ok) {{
-                        alert('Job rejected');
-                        location.reload();
-                    }} else {{
-                        alert('Failed to reject job');
-                    }}
-                }} catch (error) {{
-                    alert('Error: ' + error.message);
-                }}
-            }}
-
-            // Close modal when clicking outside
-            window.onclick = function(event) {{
-                const modal = document.getElementById('rejectModal');
-                if (event.target == modal) {{
-                    closeRejectModal();
-                }}
-            }}
-        </script>
-    </body>
-    </html>
-    """
+    parts.append(_DASHBOARD_SCRIPT)
 
-    return html
+    page = "".join(parts)
+    _review_page_cache = (dashboard_cache, page)
+    return page
 
 
 @app.post("/apply", response_model=ApplyResponse)
@@ -963,15 +1447,7 @@ async def apply_to_job(request: ApplyRequest) -> ApplyResponse:
     audit_run_id = await create_audit_run(trigger="USER", job_ids=[job_id])
 
     # Load dashboard to get job details
-    dashboard_data = _load_dashboard()
-    job_data = None
-    for job in dashboard_data.get("jobs", []):
-        if job["job_id"] == job_id:
-            job_data = job
-            break
-
-    if not job_data:
-        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    job_data = await asyncio.to_thread(_load_dashboard_job, job_id)
 
     # Check if job is approved
     if job_data.get("status") != ApplicationStatus.READY_TO_APPLY.value:
@@ -990,28 +1466,16 @@ async def apply_to_job(request: ApplyRequest) -> ApplyResponse:
     phone = contact.get("phone", "")
 
     # Get job folder for storing evidence
-    jobsearch_home = _jobsearch_home()
-    normalized_job_id = job_id.replace("_", "").replace(",", "").lower()
-    job_folder = None
-
-    for folder in (jobsearch_home / "jobs").iterdir():
-        if folder.is_dir():
-            normalized_folder = folder.name.replace("_", "").replace(",", "").lower()
-            if normalized_job_id in normalized_folder:
-                job_folder = folder
-                break
+    folder_index = await asyncio.to_thread(_cached_folder_index)
+    job_folder = folder_index.get(_norm(job_id)) or next(
+        iter(_matching_folders(job_id, folder_index)), None
+    )
 
     if not job_folder:
         raise HTTPException(status_code=404, detail=f"Job folder not found for {job_id}")
 
     # Determine source from job_id prefix
-    source = "unknown"
-    if job_id.startswith("gh_"):
-        source = "greenhouse"
-    elif job_id.startswith("lever_"):
-        source = "lever"
-    elif job_id.startswith("wd_"):
-        source = "workday"
+    source = _SOURCE_BY_PREFIX.get(job_id.partition("_")[0], "unknown")
 
     apply_url = job_data.get("apply_url", "")
     timestamp = datetime.now().strftime("%Y%m%dT%H%M%SZ")
@@ -1039,6 +1503,7 @@ async def apply_to_job(request: ApplyRequest) -> ApplyResponse:
     # Fallback to browser automation
     try:
         result = await _apply_via_browser_with_audit(
+            source=source,
             apply_url=apply_url,
             job_id=job_id,
             full_name=full_name,
@@ -1136,7 +1601,6 @@ Your application materials have been submitted."""
                 pass
 
         # Send notification
-        notify_url = _notify_service_url()
         payload = {
             "channel": channel,
             "to": recipient,
@@ -1145,13 +1609,16 @@ Your application materials have been submitted."""
             "links": links,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(f"{notify_url}/notify", json=payload)
+        response = await _client.post(
+            f"{_NOTIFY_URL}/notify", json=payload, timeout=30.0
+        )
 
-            if response.status_code == 200:
-                logger.info(f"Notification sent to {recipient} via {channel}")
-            else:
-                logger.warning(f"Notification failed: {response.status_code} - {response.text}")
+        if response.status_code == 200:
+            logger.info(f"Notification sent to {recipient} via {channel}")
+        else:
+            logger.warning(
+                f"Notification failed: {response.status_code} - {response.text}"
+            )
 
     except Exception as exc:
         # Don't fail the application if notification fails
@@ -1206,7 +1673,218 @@ async def _apply_via_api(
     )
 
 
+@contextlib.asynccontextmanager
+async def _browser_context() -> AsyncIterator[Any]:
+    """Open an isolated browser context on the shared Chromium instance.
+
+    Chromium is launched on first use and kept running for later applies;
+    each apply only creates and closes its own context, so cookies and
+    storage are not shared between applications.
+
+    Yields:
+        Playwright BrowserContext
+    """
+    global _playwright, _browser
+    async with _browser_slots:
+        async with _browser_lock:
+            if _browser is None or not _browser.is_connected():
+                from playwright.async_api import async_playwright
+
+                if _playwright is None:
+                    _playwright = await async_playwright().start()
+                _browser = await _playwright.chromium.launch(headless=True)
+                logger.info("Launched shared Chromium browser")
+            browser = _browser
+
+        context = await browser.new_context()
+        try:
+            yield context
+        finally:
+            await context.close()
+
+
+async def _close_browser() -> None:
+    """Close the shared browser and stop Playwright, if they were started."""
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+# JPEG quality for intermediate apply screenshots; the post-submit
+# screenshot stays PNG as the lossless record of the confirmation page
+_SCREENSHOT_JPEG_QUALITY = 70
+
+# Candidate selectors for the form elements _apply_via_browser looks for,
+# tried in order. The generic lists work on any form; the per-source lists
+# target the field names each applicant tracking system renders.
+_GENERIC_SELECTORS: dict[str, list[str]] = {
+    "name": [
+        'input[name*="name"]',
+        'input[placeholder*="name"]',
+        'input[id*="name"]',
+        'input[type="text"][name*="first"]',
+    ],
+    "email": [
+        'input[type="email"]',
+        'input[name*="email"]',
+        'input[placeholder*="email"]',
+    ],
+    "phone": [
+        'input[type="tel"]',
+        'input[name*="phone"]',
+        'input[placeholder*="phone"]',
+    ],
+    "upload": [
+        'input[type="file"][name*="resume"]',
+        'input[type="file"][name*="cv"]',
+        'input[type="file"]',
+    ],
+    "submit": [
+        'button[type="submit"]',
+        'input[type="submit"]',
+        'button:has-text("Submit")',
+        'button:has-text("Apply")',
+        'button:has-text("Send")',
+    ],
+}
+_SOURCE_SELECTORS: dict[str, dict[str, list[str]]] = {
+    "greenhouse": {
+        "name": ["#first_name", 'input[name="job_application[first_name]"]'],
+        "email": ["#email", 'input[name="job_application[email]"]'],
+        "phone": ["#phone", 'input[name="job_application[phone]"]'],
+        "upload": [
+            'input[type="file"][name="job_application[resume]"]',
+            'input[type="file"]#resume',
+        ],
+        "submit": ["#submit_app"],
+    },
+    "lever": {
+        "name": ['input[name="name"]'],
+        "email": ['input[name="email"]'],
+        "phone": ['input[name="phone"]'],
+        "upload": ['input[type="file"][name="resume"]'],
+        "submit": ["#btn-submit"],
+    },
+    "workday": {
+        "name": ['input[data-automation-id="legalNameSection_firstName"]'],
+        "email": ['input[data-automation-id="email"]'],
+        "phone": ['input[data-automation-id="phone-number"]'],
+        "upload": ['input[type="file"][data-automation-id="file-upload-input-ref"]'],
+        "submit": ['button[data-automation-id="bottom-navigation-next-button"]'],
+    },
+}
+
+# Per-source selector plans built once at import: the source's own
+# selectors first, then the generic candidates as a fallback
+_SELECTOR_PLANS: dict[str, dict[str, list[str]]] = {
+    source: {
+        field: list(dict.fromkeys(selectors.get(field, []) + generic))
+        for field, generic in _GENERIC_SELECTORS.items()
+    }
+    for source, selectors in _SOURCE_SELECTORS.items()
+}
+
+# Maps each field name to the candidate CSS selectors present on the page,
+# in candidate order, so form probing costs a single page.evaluate
+_MATCHING_SELECTORS_JS = """
+(mapping) => {
+    const present = {};
+    for (const [field, selectors] of Object.entries(mapping)) {
+        present[field] = selectors.filter(
+            (selector) => document.querySelector(selector)
+        );
+    }
+    return present;
+}
+"""
+
+# First of the given CSS selectors that matches an element, or null
+_FIRST_MATCHING_SELECTOR_JS = """
+(selectors) => selectors.find((selector) => document.querySelector(selector)) || null
+"""
+
+# Words that mark a post-submit element as an application confirmation
+_CONFIRM_KEYWORDS = ("confirmation", "success", "submitted", "received")
+
+# Confirmation keywords already present in the page text
+_PRESENT_KEYWORDS_JS = """
+(keywords) => {
+    const text = (document.body && document.body.innerText || "").toLowerCase();
+    return keywords.filter((keyword) => text.includes(keyword));
+}
+"""
+
+# True once the page has left the given URL or its text contains one of the
+# keywords (those that were absent before submit)
+_CONFIRMATION_SHOWN_JS = """
+({url, keywords}) => {
+    if (window.location.href !== url) return true;
+    const text = (document.body && document.body.innerText || "").toLowerCase();
+    return keywords.some((keyword) => text.includes(keyword));
+}
+"""
+
+# Text (first 100 characters) of the first element matched by one of the
+# selectors whose text contains a confirmation keyword, or ""
+_CONFIRMATION_TEXT_JS = """
+({selectors, keywords}) => {
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (!el) continue;
+        const text = el.innerText || "";
+        const lower = text.toLowerCase();
+        if (keywords.some((keyword) => lower.includes(keyword))) {
+            return text.slice(0, 100);
+        }
+    }
+    return "";
+}
+"""
+
+# First of the given CSS selectors whose first match is visible, or null
+_FIRST_VISIBLE_SELECTOR_JS = """
+(selectors) => selectors.find((selector) => {
+    const el = document.querySelector(selector);
+    if (!el) return false;
+    const rect = el.getBoundingClientRect();
+    return (
+        rect.width > 0
+        && rect.height > 0
+        && getComputedStyle(el).visibility !== "hidden"
+    );
+}) || null
+"""
+
+# Describes every required, still-empty form field (file inputs excluded)
+_EMPTY_REQUIRED_FIELDS_JS = """
+() => Array.from(
+    document.querySelectorAll(
+        'input[required]:not([type="file"]), select[required], textarea[required]'
+    )
+)
+    .filter((el) => !el.value)
+    .map((el) => {
+        const tag = el.tagName.toLowerCase();
+        const label = el.id
+            ? document.querySelector(`label[for="${CSS.escape(el.id)}"]`)
+            : null;
+        return {
+            name: el.getAttribute("name") || "",
+            id: el.id || "",
+            tag: tag,
+            type: tag === "input" ? el.getAttribute("type") || "text" : tag,
+            label: label ? label.innerText : "",
+        };
+    })
+"""
+
+
 async def _apply_via_browser(
+    source: str,
     apply_url: str,
     job_id: str,
     full_name: str,
@@ -1219,6 +1897,7 @@ async def _apply_via_browser(
     """Apply via browser automation using Playwright.
 
     Args:
+        source: Source system (greenhouse, lever, workday or unknown)
         apply_url: Application URL
         job_id: Job ID
         full_name: Applicant full name
@@ -1232,11 +1911,11 @@ async def _apply_via_browser(
         ApplyResponse with results
     """
     from playwright.async_api import TimeoutError as PlaywrightTimeout
-    from playwright.async_api import async_playwright
 
     logger.info(f"Starting browser automation for {apply_url}")
 
     screenshots = []
+    screenshot_tasks: list[asyncio.Task] = []
     required_fields = []
     confirmation_id = ""
     evidence_data = {
@@ -1247,19 +1926,41 @@ async def _apply_via_browser(
     }
 
     try:
-        async with async_playwright() as p:
-            # Launch browser
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
+        async with _browser_context() as context:
             page = await context.new_page()
+            # Fail fast on a candidate field that never becomes actionable
+            # so the next candidate is tried
+            page.set_default_timeout(10000)
+
+            def take_screenshot(name: str, **options) -> asyncio.Task:
+                # Start the capture and return its task. Evidence of a step
+                # that the next action changes (filled form, pre-submit,
+                # submitted) must be awaited at the call site so the image
+                # shows that step; other captures may finish in the
+                # background and are awaited before returning
+                screenshot_path = job_folder / name
+                screenshots.append(str(screenshot_path))
+                task = asyncio.create_task(
+                    page.screenshot(path=screenshot_path, **options)
+                )
+                screenshot_tasks.append(task)
+                return task
 
             # Step 1: Navigate to application page
             logger.info(f"Navigating to {apply_url}")
-            await page.goto(apply_url, wait_until="networkidle", timeout=30000)
+            # Analytics and CAPTCHA beacons keep many ATS pages from ever
+            # going network-idle, so wait for the DOM and the form instead
+            await page.goto(apply_url, wait_until="domcontentloaded", timeout=15000)
+            try:
+                await page.wait_for_selector("input, select, textarea", timeout=10000)
+            except PlaywrightTimeout:
+                logger.warning("Timeout waiting for form fields to render")
 
-            screenshot_path = job_folder / f"apply_step1_load_{timestamp}.png"
-            await page.screenshot(path=screenshot_path)
-            screenshots.append(str(screenshot_path))
+            take_screenshot(
+                f"apply_step1_load_{timestamp}.jpg",
+                type="jpeg",
+                quality=_SCREENSHOT_JPEG_QUALITY,
+            )
             evidence_data["steps"].append({"step": 1, "action": "navigate", "url": apply_url})
 
             # Step 2: Detect CAPTCHA
@@ -1271,175 +1972,127 @@ async def _apply_via_browser(
                 "[data-callback='captcha']",
             ]
 
-            for selector in captcha_selectors:
-                if await page.query_selector(selector):
-                    logger.warning("CAPTCHA detected")
-                    evidence_data["steps"].append({"step": 2, "action": "captcha_detected"})
-
-                    screenshot_path = job_folder / f"apply_captcha_{timestamp}.png"
-                    await page.screenshot(path=screenshot_path)
-                    screenshots.append(str(screenshot_path))
+            selector = await page.evaluate(
+                _FIRST_MATCHING_SELECTOR_JS, captcha_selectors
+            )
+            if selector:
+                logger.warning("CAPTCHA detected")
+                evidence_data["steps"].append({"step": 2, "action": "captcha_detected"})
+
+                take_screenshot(
+                    f"apply_captcha_{timestamp}.jpg",
+                    type="jpeg",
+                    quality=_SCREENSHOT_JPEG_QUALITY,
+                )
+                await asyncio.gather(*screenshot_tasks)
 
-                    await browser.close()
-                    return ApplyResponse(
-                        job_id=job_id,
-                        status="NEEDS_INPUT",
-                        method="BROWSER",
-                        screenshots=screenshots,
-                        required_fields=[
-                            RequiredField(
-                                selector=selector,
-                                field_type="captcha",
-                                label="CAPTCHA verification required",
-                            )
-                        ],
-                        evidence_path=str(job_folder / f"evidence_{timestamp}.json"),
-                    )
+                return ApplyResponse(
+                    job_id=job_id,
+                    status="NEEDS_INPUT",
+                    method="BROWSER",
+                    screenshots=screenshots,
+                    required_fields=[
+                        RequiredField(
+                            selector=selector,
+                            field_type="captcha",
+                            label="CAPTCHA verification required",
+                        )
+                    ],
+                    evidence_path=str(job_folder / f"evidence_{timestamp}.json"),
+                )
 
             # Step 3: Fill common form fields
+            plan = _SELECTOR_PLANS.get(source, _GENERIC_SELECTORS)
             field_mappings = {
-                "name": [
-                    'input[name*="name"]',
-                    'input[placeholder*="name"]',
-                    'input[id*="name"]',
-                    'input[type="text"][name*="first"]',
-                ],
-                "email": [
-                    'input[type="email"]',
-                    'input[name*="email"]',
-                    'input[placeholder*="email"]',
-                ],
-                "phone": [
-                    'input[type="tel"]',
-                    'input[name*="phone"]',
-                    'input[placeholder*="phone"]',
-                ],
+                field: plan[field] for field in ("name", "email", "phone")
             }
 
             filled_fields = {}
 
-            # Try to fill name
-            for selector in field_mappings["name"]:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        await element.fill(full_name)
-                        filled_fields["name"] = selector
-                        logger.info(f"Filled name field: {selector}")
-                        break
-                except Exception as exc:
-                    logger.debug(f"Could not fill {selector}: {exc}")
-
-            # Try to fill email
-            for selector in field_mappings["email"]:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        await element.fill(email)
-                        filled_fields["email"] = selector
-                        logger.info(f"Filled email field: {selector}")
-                        break
-                except Exception as exc:
-                    logger.debug(f"Could not fill {selector}: {exc}")
+            # Probe every candidate selector in one round trip, then fill
+            # each field through the first candidate that accepts the value.
+            # Fills go one at a time: page.fill types into the focused
+            # element, so interleaved fills can land in the wrong input
+            present = await page.evaluate(_MATCHING_SELECTORS_JS, field_mappings)
+            field_values = {"name": full_name, "email": email, "phone": phone}
 
-            # Try to fill phone
-            for selector in field_mappings["phone"]:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        await element.fill(phone)
-                        filled_fields["phone"] = selector
-                        logger.info(f"Filled phone field: {selector}")
+            for field, value in field_values.items():
+                for selector in present.get(field, []):
+                    try:
+                        await page.fill(selector, value)
+                        filled_fields[field] = selector
+                        logger.info(f"Filled {field} field: {selector}")
                         break
-                except Exception as exc:
-                    logger.debug(f"Could not fill {selector}: {exc}")
+                    except Exception as exc:
+                        logger.debug(f"Could not fill {selector}: {exc}")
 
             evidence_data["steps"].append({"step": 3, "action": "fill_fields", "fields": filled_fields})
 
-            screenshot_path = job_folder / f"apply_step3_filled_{timestamp}.png"
-            await page.screenshot(path=screenshot_path)
-            screenshots.append(str(screenshot_path))
+            await take_screenshot(
+                f"apply_step3_filled_{timestamp}.jpg",
+                type="jpeg",
+                quality=_SCREENSHOT_JPEG_QUALITY,
+            )
 
             # Step 4: Upload CV and cover letter
             cv_path = job_data.get("cv_pdf_path", "")
             cover_path = job_data.get("cover_letter_pdf_path", "")
 
-            upload_selectors = [
-                'input[type="file"][name*="resume"]',
-                'input[type="file"][name*="cv"]',
-                'input[type="file"]',
-            ]
+            upload_selectors = plan["upload"]
 
             if cv_path and Path(cv_path).exists():
-                for selector in upload_selectors:
+                present = await page.evaluate(
+                    _MATCHING_SELECTORS_JS, {"upload": upload_selectors}
+                )
+                for selector in present["upload"]:
                     try:
-                        element = await page.query_selector(selector)
-                        if element:
-                            await element.set_input_files(cv_path)
-                            logger.info(f"Uploaded CV to {selector}")
-                            evidence_data["steps"].append(
-                                {"step": 4, "action": "upload_cv", "selector": selector}
-                            )
-                            break
+                        await page.set_input_files(selector, cv_path)
+                        logger.info(f"Uploaded CV to {selector}")
+                        evidence_data["steps"].append(
+                            {"step": 4, "action": "upload_cv", "selector": selector}
+                        )
+                        break
                     except Exception as exc:
                         logger.debug(f"Could not upload to {selector}: {exc}")
 
-            screenshot_path = job_folder / f"apply_step4_uploaded_{timestamp}.png"
-            await page.screenshot(path=screenshot_path)
-            screenshots.append(str(screenshot_path))
+            await take_screenshot(
+                f"apply_step4_uploaded_{timestamp}.jpg",
+                type="jpeg",
+                quality=_SCREENSHOT_JPEG_QUALITY,
+            )
 
             # Step 5: Look for unknown/required fields
-            # Check for empty required fields
-            required_inputs = await page.query_selector_all('input[required]:not([type="file"])')
-            required_selects = await page.query_selector_all("select[required]")
-            required_textareas = await page.query_selector_all("textarea[required]")
-
-            all_required = required_inputs + required_selects + required_textareas
-
-            for element in all_required:
-                try:
-                    value = await element.input_value() if hasattr(element, "input_value") else ""
-                    if not value:
-                        # Get field label
-                        label_text = ""
-                        try:
-                            label_element = await page.query_selector(
-                                f'label[for="{await element.get_attribute("id")}"]'
-                            )
-                            if label_element:
-                                label_text = await label_element.inner_text()
-                        except Exception:
-                            pass
-
-                        field_name = await element.get_attribute("name") or ""
-                        field_type = await element.get_attribute("type") or "text"
-                        tag_name = await element.evaluate("el => el.tagName.toLowerCase()")
-
-                        if tag_name == "select":
-                            field_type = "select"
-                        elif tag_name == "textarea":
-                            field_type = "textarea"
-
-                        required_fields.append(
-                            RequiredField(
-                                selector=f'[name="{field_name}"]' if field_name else str(element),
-                                field_type=field_type,
-                                label=label_text or field_name,
-                            )
-                        )
-                except Exception as exc:
-                    logger.debug(f"Error checking required field: {exc}")
+            # Collect every empty required field in one round trip
+            for field in await page.evaluate(_EMPTY_REQUIRED_FIELDS_JS):
+                if field["name"]:
+                    selector = f'[name="{field["name"]}"]'
+                elif field["id"]:
+                    selector = f'[id="{field["id"]}"]'
+                else:
+                    selector = field["tag"]
+                required_fields.append(
+                    RequiredField(
+                        selector=selector,
+                        field_type=field["type"],
+                        label=field["label"] or field["name"],
+                    )
+                )
 
             if required_fields:
                 logger.warning(f"Found {len(required_fields)} unfilled required fields")
-                screenshot_path = job_folder / f"apply_needs_input_{timestamp}.png"
-                await page.screenshot(path=screenshot_path)
-                screenshots.append(str(screenshot_path))
+                take_screenshot(
+                    f"apply_needs_input_{timestamp}.jpg",
+                    type="jpeg",
+                    quality=_SCREENSHOT_JPEG_QUALITY,
+                )
+                await asyncio.gather(*screenshot_tasks)
 
                 evidence_path = job_folder / f"evidence_{timestamp}.json"
-                evidence_path.write_text(json.dumps(evidence_data, indent=2))
+                await asyncio.to_thread(
+                    evidence_path.write_bytes,
+                    orjson.dumps(evidence_data, option=orjson.OPT_INDENT_2),
+                )
 
-                await browser.close()
                 return ApplyResponse(
                     job_id=job_id,
                     status="NEEDS_INPUT",
@@ -1450,20 +2103,36 @@ async def _apply_via_browser(
                 )
 
             # Step 6: Submit the form
-            submit_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button:has-text("Submit")',
-                'button:has-text("Apply")',
-                'button:has-text("Send")',
-            ]
+            # Plain CSS candidates are checked in priority order in one
+            # evaluate; the Playwright-only :has-text() candidates are then
+            # resolved together as a single locator
+            submit_selectors = plan["submit"]
+            css_selectors = [sel for sel in submit_selectors if ":has-text(" not in sel]
+            text_selectors = [sel for sel in submit_selectors if ":has-text(" in sel]
 
             submitted = False
-            for selector in submit_selectors:
+            # Job descriptions often mention "success" or "received" before
+            # anything is submitted, so only a new URL or a keyword that was
+            # absent before the click counts as confirmation
+            pre_submit_url = page.url
+            pre_submit_keywords = await page.evaluate(
+                _PRESENT_KEYWORDS_JS, list(_CONFIRM_KEYWORDS)
+            )
+            new_keywords = [
+                kw for kw in _CONFIRM_KEYWORDS if kw not in pre_submit_keywords
+            ]
+            selector = await page.evaluate(_FIRST_VISIBLE_SELECTOR_JS, css_selectors)
+            targets = [(selector, page.locator(selector).first)] if selector else []
+            if text_selectors:
+                selector = ", ".join(text_selectors)
+                targets.append(
+                    (selector, page.locator(f"{selector} >> visible=true").first)
+                )
+
+            for selector, target in targets:
                 try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        await element.click()
+                    if await target.count():
+                        await target.click()
                         submitted = True
                         logger.info(f"Clicked submit button: {selector}")
                         evidence_data["steps"].append({"step": 6, "action": "submit", "selector": selector})
@@ -1476,13 +2145,15 @@ async def _apply_via_browser(
 
             # Wait for navigation or confirmation
             try:
-                await page.wait_for_load_state("networkidle", timeout=10000)
+                await page.wait_for_function(
+                    _CONFIRMATION_SHOWN_JS,
+                    arg={"url": pre_submit_url, "keywords": new_keywords},
+                    timeout=10000,
+                )
             except PlaywrightTimeout:
-                logger.warning("Timeout waiting for page load after submit")
+                logger.warning("Timeout waiting for confirmation after submit")
 
-            screenshot_path = job_folder / f"apply_step6_submitted_{timestamp}.png"
-            await page.screenshot(path=screenshot_path)
-            screenshots.append(str(screenshot_path))
+            await take_screenshot(f"apply_step6_submitted_{timestamp}.png")
 
             # Try to extract confirmation ID
             confirmation_selectors = [
@@ -1493,27 +2164,26 @@ async def _apply_via_browser(
                 'h2',
             ]
 
-            for selector in confirmation_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        text = await element.inner_text()
-                        if any(
-                            keyword in text.lower()
-                            for keyword in ["confirmation", "success", "submitted", "received"]
-                        ):
-                            confirmation_id = text[:100]  # Limit length
-                            break
-                except Exception:
-                    pass
+            try:
+                confirmation_id = await page.evaluate(
+                    _CONFIRMATION_TEXT_JS,
+                    {
+                        "selectors": confirmation_selectors,
+                        "keywords": list(_CONFIRM_KEYWORDS),
+                    },
+                )
+            except Exception as exc:
+                logger.debug(f"Could not read confirmation text: {exc}")
 
             evidence_data["confirmation_id"] = confirmation_id
             evidence_data["success"] = True
+            await asyncio.gather(*screenshot_tasks)
 
             evidence_path = job_folder / f"evidence_{timestamp}.json"
-            evidence_path.write_text(json.dumps(evidence_data, indent=2))
-
-            await browser.close()
+            await asyncio.to_thread(
+                evidence_path.write_bytes,
+                orjson.dumps(evidence_data, option=orjson.OPT_INDENT_2),
+            )
 
             # Send notification after successful application
             await _send_application_notification(
@@ -1534,9 +2204,13 @@ async def _apply_via_browser(
     except Exception as exc:
         logger.error(f"Browser automation error: {exc}")
         raise
+    finally:
+        # Reap captures left running when a step failed part-way
+        await asyncio.gather(*screenshot_tasks, return_exceptions=True)
 
 
 async def _apply_via_browser_with_audit(
+    source: str,
     apply_url: str,
     job_id: str,
     full_name: str,
@@ -1551,6 +2225,7 @@ async def _apply_via_browser_with_audit(
     """Wrapper for _apply_via_browser with audit logging.
 
     Args:
+        source: Source system (greenhouse, lever, workday or unknown)
         apply_url: Application URL
         job_id: Job ID
         full_name: Applicant full name
@@ -1566,6 +2241,7 @@ async def _apply_via_browser_with_audit(
         ApplyResponse with results
     """
     result = await _apply_via_browser(
+        source=source,
         apply_url=apply_url,
         job_id=job_id,
         full_name=full_name,
@@ -1577,11 +2253,12 @@ async def _apply_via_browser_with_audit(
     )
 
     # Log audit entry
-    artifacts = []
+    artifact_paths = []
     if result.evidence_path:
-        artifacts.append(create_artifact_record(result.evidence_path, "evidence"))
+        artifact_paths.append((result.evidence_path, "evidence"))
     for screenshot in result.screenshots:
-        artifacts.append(create_artifact_record(screenshot, "screenshot"))
+        artifact_paths.append((screenshot, "screenshot"))
+    artifacts = await create_artifact_records(artifact_paths)
 
     await log_audit_entry(
         run_id=audit_run_id,
@@ -1647,7 +2324,7 @@ async def _apply_via_api_with_audit(
     # Log audit entry
     artifacts = []
     if result.evidence_path:
-        artifacts.append(create_artifact_record(result.evidence_path, "evidence"))
+        artifacts.append(await create_artifact_record(result.evidence_path, "evidence"))
 
     await log_audit_entry(
         run_id=audit_run_id,
@@ -1898,7 +2575,9 @@ async def _apply_via_browser_original(
                 screenshots.append(str(screenshot_path))
 
                 evidence_path = job_folder / f"evidence_{timestamp}.json"
-                evidence_path.write_text(json.dumps(evidence_data, indent=2))
+                evidence_path.write_bytes(
+                    orjson.dumps(evidence_data, option=orjson.OPT_INDENT_2)
+                )
 
                 await browser.close()
                 return ApplyResponse(
@@ -1972,7 +2651,9 @@ async def _apply_via_browser_original(
             evidence_data["success"] = True
 
             evidence_path = job_folder / f"evidence_{timestamp}.json"
-            evidence_path.write_text(json.dumps(evidence_data, indent=2))
+            evidence_path.write_bytes(
+                orjson.dumps(evidence_data, option=orjson.OPT_INDENT_2)
+            )
 
             await browser.close()
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ApplicationStatus(str, Enum):
@@ -71,12 +71,16 @@ class PrepareResponse(BaseModel):
 class ApproveRequest(BaseModel):
     """Request to approve a job application."""
 
+    model_config = ConfigDict(frozen=True)
+
     job_id: str = Field(..., description="Job ID to approve")
 
 
 class RejectRequest(BaseModel):
     """Request to reject a job application."""
 
+    model_config = ConfigDict(frozen=True)
+
     job_id: str = Field(..., description="Job ID to reject")
     reason: str = Field(..., description="Reason for rejection")
 
@@ -92,12 +96,16 @@ class ReviewResponse(BaseModel):
 class ApplyRequest(BaseModel):
     """Request to apply to a job."""
 
+    model_config = ConfigDict(frozen=True)
+
     job_id: str = Field(..., description="Job ID to apply to")
 
 
 class RequiredField(BaseModel):
     """Field that requires user input."""
 
+    model_config = ConfigDict(frozen=True)
+
     selector: str = Field(..., description="CSS selector for the field")
     field_type: str = Field(..., description="Type of field (text, select, file, etc)")
     label: str = Field(default="", description="Field label if available")
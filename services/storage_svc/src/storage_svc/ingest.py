@@ -5,6 +5,7 @@ import logging
 import re
 import os
 from io import BytesIO
+from functools import lru_cache
 from tempfile import NamedTemporaryFile
 from typing import Any, Iterable
 
@@ -17,6 +18,7 @@ EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 PHONE_RE = re.compile(r"(\+?\d[\d\s\-().]{7,}\d)")
 LOCATION_RE = re.compile(r"\b(?:based|located)\s+in\s+([A-Za-z\s,]+)", re.IGNORECASE)
 REMOTE_RE = re.compile(r"\b(remote|hybrid)\b", re.IGNORECASE)
+PLAIN_TEXT_SUFFIXES = (".txt", ".md", ".markdown", ".csv")
 
 
 def redact_pii(value: str) -> str:
@@ -36,6 +38,51 @@ def _save_named_tempfile(data: bytes, suffix: str) -> str:
     return temp.name
 
 
+# The document parsers are heavy and optional. Each getter imports its parser
+# on first use and caches it, so startup does not pay for parsers an upload
+# never needs, and later uploads skip the import machinery. lru_cache does not
+# cache exceptions, so a missing parser raises ImportError on every call;
+# a missing PyMuPDF is cached as ``None``.
+
+
+@lru_cache(maxsize=None)
+def _get_fitz() -> Any:
+    """Return the PyMuPDF module, or ``None`` when it is not installed."""
+
+    try:
+        import fitz
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return fitz
+
+
+@lru_cache(maxsize=None)
+def _get_pdf_reader() -> Any:
+    """Return pypdf's ``PdfReader`` class, importing pypdf on first use."""
+
+    from pypdf import PdfReader
+
+    return PdfReader
+
+
+@lru_cache(maxsize=None)
+def _get_docx2txt() -> Any:
+    """Return the ``docx2txt`` module, importing it on first use."""
+
+    import docx2txt
+
+    return docx2txt
+
+
+@lru_cache(maxsize=None)
+def _get_textract() -> Any:
+    """Return the ``textract`` module, importing it on first use."""
+
+    import textract
+
+    return textract
+
+
 def extract_text_from_bytes(filename: str, content_type: str | None, data: bytes) -> str:
     """Extract plain text from a raw CV payload."""
 
@@ -49,21 +96,37 @@ def extract_text_from_bytes(filename: str, content_type: str | None, data: bytes
     ct = (content_type or "").lower()
 
     try:
-        if name_lower.endswith(".pdf") or "pdf" in ct:
-            try:
-                from pypdf import PdfReader
-            except ImportError as exc:  # pragma: no cover - import guard
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="PDF support not available on server.",
-                ) from exc
+        if name_lower.endswith(PLAIN_TEXT_SUFFIXES) or ct.startswith("text/"):
+            # Plain text needs no parser; decode it directly.
+            text = data.decode("utf-8", errors="ignore")
+            if not text.strip():
+                raise ValueError("No text extracted from uploaded document.")
+            return text
 
-            reader = PdfReader(BytesIO(data))
+        if name_lower.endswith(".pdf") or "pdf" in ct:
             text_segments = []
-            for page in reader.pages:
-                extracted = page.extract_text() or ""
-                if extracted:
-                    text_segments.append(extracted)
+            fitz = _get_fitz()
+            if fitz is not None:
+                # PyMuPDF parses each content stream in C, far faster than pypdf.
+                with fitz.open(stream=data, filetype="pdf") as doc:
+                    for page in doc:
+                        extracted = page.get_text("text")
+                        if extracted:
+                            text_segments.append(extracted)
+            else:
+                try:
+                    PdfReader = _get_pdf_reader()
+                except ImportError as exc:  # pragma: no cover - import guard
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail="PDF support not available on server.",
+                    ) from exc
+
+                reader = PdfReader(BytesIO(data))
+                for page in reader.pages:
+                    extracted = page.extract_text() or ""
+                    if extracted:
+                        text_segments.append(extracted)
             text = "\n".join(text_segments)
             if not text.strip():
                 raise ValueError("No text extracted from PDF document.")
@@ -71,7 +134,7 @@ def extract_text_from_bytes(filename: str, content_type: str | None, data: bytes
 
         if name_lower.endswith(".docx") or "word" in ct or name_lower.endswith(".doc"):
             try:
-                import docx2txt
+                docx2txt = _get_docx2txt()
             except ImportError as exc:  # pragma: no cover - import guard
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -92,7 +155,7 @@ def extract_text_from_bytes(filename: str, content_type: str | None, data: bytes
 
         # Fallback to textract for other document types.
         try:
-            import textract
+            textract = _get_textract()
         except ImportError as exc:  # pragma: no cover - import guard
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SERVICE_SRC = PROJECT_ROOT / "services" / "audit_svc" / "src"
+
+if str(SERVICE_SRC) not in sys.path:
+    sys.path.insert(0, str(SERVICE_SRC))
+
+from audit_svc import main as audit_main  # noqa: E402
+
+
+def _entry(run_id: str, operation: str, status: str = "SUCCESS") -> dict[str, object]:
+    return {
+        "run_id": run_id,
+        "operation": operation,
+        "timestamp_start": "2025-01-01T12:00:00",
+        "status": status,
+    }
+
+
+def test_log_batch_persists_entries_with_one_load_and_save(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("JOBSEARCH_HOME", str(tmp_path))
+    client = TestClient(audit_main.app)
+
+    run_id = client.post("/audit/run", json={"trigger": "USER"}).json()["run_id"]
+
+    loads: list[str] = []
+    saves: list[str] = []
+    load_run, save_run = audit_main._load_run, audit_main._save_run
+
+    def counting_load(run_id: str):
+        loads.append(run_id)
+        return load_run(run_id)
+
+    def counting_save(run) -> None:
+        saves.append(run.run_id)
+        save_run(run)
+
+    monkeypatch.setattr(audit_main, "_load_run", counting_load)
+    monkeypatch.setattr(audit_main, "_save_run", counting_save)
+
+    entries = [
+        _entry(run_id, "BUILD_CV"),
+        _entry(run_id, "VALIDATE"),
+        _entry(run_id, "APPLY", status="FAILED"),
+    ]
+    response = client.post("/audit/log/batch", json={"entries": entries})
+
+    assert response.status_code == 200
+    assert len(response.json()["entry_ids"]) == 3
+    assert loads == [run_id]
+    assert saves == [run_id]
+
+    run = client.get(f"/audit/{run_id}").json()
+    assert [entry["operation"] for entry in run["entries"]] == [
+        "BUILD_CV",
+        "VALIDATE",
+        "APPLY",
+    ]
+    assert run["total_operations"] == 3
+    assert run["successful_operations"] == 2
+    assert run["failed_operations"] == 1
+
+
+def test_log_batch_missing_run_returns_404(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("JOBSEARCH_HOME", str(tmp_path))
+    client = TestClient(audit_main.app)
+
+    response = client.post(
+        "/audit/log/batch", json={"entries": [_entry("run_missing", "APPLY")]}
+    )
+
+    assert response.status_code == 404
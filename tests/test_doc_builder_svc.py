@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SERVICE_SRC = PROJECT_ROOT / "services" / "doc_builder_svc" / "src"
+
+if str(SERVICE_SRC) not in sys.path:
+    sys.path.insert(0, str(SERVICE_SRC))
+
+from doc_builder_svc import main as doc_builder  # noqa: E402
+
+
+def test_single_flight_runs_load_once_for_concurrent_callers() -> None:
+    calls = 0
+
+    async def load() -> dict[str, str]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"name": "Jane"}
+
+    async def run() -> list[dict[str, str]]:
+        return await asyncio.gather(
+            *(doc_builder._single_flight(("profile", ""), load) for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert results == [{"name": "Jane"}] * 5
+    assert doc_builder._inflight == {}
+
+
+def test_single_flight_shares_exception_and_clears_inflight() -> None:
+    calls = 0
+
+    async def load() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("storage down")
+
+    async def run() -> list[object]:
+        return await asyncio.gather(
+            *(doc_builder._single_flight(("job", "gh_acme_1"), load) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert doc_builder._inflight == {}
+
+    # A later call runs the lookup again instead of reusing the failure
+    with pytest.raises(RuntimeError):
+        asyncio.run(doc_builder._single_flight(("job", "gh_acme_1"), load))
+    assert calls == 2
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SERVICE_SRC = PROJECT_ROOT / "services" / "job_finder_svc" / "src"
+
+if str(SERVICE_SRC) not in sys.path:
+    sys.path.insert(0, str(SERVICE_SRC))
+
+from job_finder_svc import adapters  # noqa: E402
+from job_finder_svc.main import _canonical_url, _dedupe_postings  # noqa: E402
+from job_finder_svc.models import JobPosting  # noqa: E402
+
+
+def _posting(job_id: str, apply_url: str, source: str = "greenhouse") -> JobPosting:
+    return JobPosting(
+        id=job_id,
+        title="Engineer",
+        company="Acme",
+        location="Remote",
+        jd_text="Build things.",
+        source=source,
+        apply_url=apply_url,
+    )
+
+
+def test_canonical_url_strips_tracking_params_and_fragment() -> None:
+    url = (
+        "https://boards.example.com/acme/jobs/1"
+        "?utm_source=li&gh_jid=1&gclid=abc&utm_campaign=x#apply"
+    )
+
+    assert _canonical_url(url) == "https://boards.example.com/acme/jobs/1?gh_jid=1"
+
+
+def test_canonical_url_keeps_generic_params() -> None:
+    url = "https://jobs.example.com/apply?source=careers&ref=2"
+
+    assert _canonical_url(url) == "https://jobs.example.com/apply?ref=2&source=careers"
+
+
+def test_canonical_url_lowercases_scheme_and_host_only() -> None:
+    url = "HTTPS://Jobs.Example.COM/Acme/Apply"
+
+    assert _canonical_url(url) == "https://jobs.example.com/Acme/Apply"
+
+
+def test_dedupe_postings_keeps_first_by_source_and_id() -> None:
+    first = _posting("gh_acme_1", "https://example.com/a")
+    repeat = _posting("gh_acme_1", "https://example.com/b")
+    other_source = _posting("gh_acme_1", "https://example.com/c", source="lever")
+
+    assert _dedupe_postings([first, repeat, other_source]) == [first, other_source]
+
+
+def test_dedupe_postings_keeps_first_by_canonical_url() -> None:
+    first = _posting("gh_acme_1", "https://example.com/jobs/1?utm_source=a")
+    repeat = _posting("lever_acme_1", "https://EXAMPLE.com/jobs/1#top", source="lever")
+    distinct = _posting("gh_acme_2", "https://example.com/jobs/1?gh_jid=2")
+
+    assert _dedupe_postings([first, repeat, distinct]) == [first, distinct]
+
+
+def _response(status_code: int, retry_after: str | None = None) -> httpx.Response:
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return httpx.Response(status_code, headers=headers)
+
+
+@pytest.fixture
+def no_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(adapters.random, "random", lambda: 0.0)
+
+
+def test_retry_delay_uses_numeric_retry_after(no_jitter: None) -> None:
+    assert adapters._retry_delay(_response(429, "3"), attempt=0) == 3.0
+
+
+def test_retry_delay_caps_retry_after(no_jitter: None) -> None:
+    delay = adapters._retry_delay(_response(429, "3600"), attempt=0)
+
+    assert delay == adapters._MAX_BACKOFF
+
+
+def test_retry_delay_falls_back_to_backoff_for_http_date(no_jitter: None) -> None:
+    response = _response(503, "Wed, 21 Oct 2015 07:28:00 GMT")
+
+    assert adapters._retry_delay(response, attempt=1) == 2.0
+
+
+def test_retry_delay_caps_exponential_backoff(no_jitter: None) -> None:
+    assert adapters._retry_delay(_response(503), attempt=10) == adapters._MAX_BACKOFF
+
+
+def test_get_with_retry_gives_up_after_last_attempt(
+    no_jitter: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    delays: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return _response(503, "1")
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(adapters.asyncio, "sleep", fake_sleep)
+
+    async def run() -> httpx.Response:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await adapters._get_with_retry(
+                client, "https://boards.example.com/jobs", max_attempts=3
+            )
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 503
+    assert len(calls) == 3
+    # No sleep after the final attempt
+    assert delays == [1.0, 1.0]
+
+
+def test_get_with_retry_returns_first_success(
+    no_jitter: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    statuses = iter([429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return _response(next(statuses))
+
+    async def fake_sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setattr(adapters.asyncio, "sleep", fake_sleep)
+
+    async def run() -> httpx.Response:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await adapters._get_with_retry(client, "https://lever.example.com/x")
+
+    assert asyncio.run(run()).status_code == 200
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SERVICE_SRC = PROJECT_ROOT / "services" / "orchestrator" / "src"
+
+if str(SERVICE_SRC) not in sys.path:
+    sys.path.insert(0, str(SERVICE_SRC))
+
+from orchestrator import audit_helper  # noqa: E402
+
+
+def _recording_client(
+    requests: list[tuple[str, object]], batch_status: int = 200
+) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append((request.url.path, body))
+        if request.url.path == "/audit/log/batch":
+            return httpx.Response(batch_status, json={"status": "logged"})
+        return httpx.Response(200, json={"status": "logged"})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _entry(operation: str) -> dict[str, object]:
+    return {
+        "run_id": "run_1",
+        "operation": operation,
+        "timestamp_start": "2025-01-01T12:00:00",
+        "status": "SUCCESS",
+    }
+
+
+def test_audit_worker_posts_queued_entries_in_one_batch() -> None:
+    requests: list[tuple[str, object]] = []
+
+    async def run() -> None:
+        audit_helper.start_audit_worker()
+        # Swap in a recording client; close_audit_client closes and clears it
+        await audit_helper._client.aclose()
+        audit_helper._client = _recording_client(requests)
+
+        for operation in ("BUILD_CV", "VALIDATE", "APPLY"):
+            await audit_helper.log_audit_entry(
+                "run_1", operation, "2025-01-01T12:00:00", "", "SUCCESS"
+            )
+        await audit_helper.close_audit_client()
+
+    asyncio.run(run())
+
+    assert [path for path, _ in requests] == ["/audit/log/batch"]
+    batch = requests[0][1]["entries"]
+    assert [entry["operation"] for entry in batch] == ["BUILD_CV", "VALIDATE", "APPLY"]
+    assert audit_helper._client is None
+
+
+def test_post_audit_entries_falls_back_per_entry_on_404(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requests: list[tuple[str, object]] = []
+    client = _recording_client(requests, batch_status=404)
+    monkeypatch.setattr(audit_helper, "_client", client)
+
+    entries = [_entry("BUILD_CV"), _entry("APPLY")]
+    asyncio.run(audit_helper._post_audit_entries(entries))
+
+    assert [path for path, _ in requests] == [
+        "/audit/log/batch",
+        "/audit/log",
+        "/audit/log",
+    ]
+    assert [body for _, body in requests[1:]] == entries
+
+
+def test_post_audit_entries_does_not_fall_back_on_other_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requests: list[tuple[str, object]] = []
+    client = _recording_client(requests, batch_status=500)
+    monkeypatch.setattr(audit_helper, "_client", client)
+
+    asyncio.run(audit_helper._post_audit_entries([_entry("BUILD_CV"), _entry("APPLY")]))
+
+    assert [path for path, _ in requests] == ["/audit/log/batch"]
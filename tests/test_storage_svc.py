@@ -172,6 +172,18 @@ def test_ingest_cv_and_get_profile(tmp_path: Path, monkeypatch: pytest.MonkeyPat
         assert fetched["roles"][0]["title"] == "Senior Engineer"
 
 
+def test_extract_text_decodes_plain_text_uploads() -> None:
+    from storage_svc.ingest import extract_text_from_bytes
+
+    data = "Jane Doe\nSkills: Python, SQL".encode("utf-8")
+
+    text = extract_text_from_bytes("cv.md", None, data)
+    charset_text = extract_text_from_bytes("cv", "text/plain; charset=utf-8", data)
+
+    assert text == "Jane Doe\nSkills: Python, SQL"
+    assert charset_text.startswith("Jane Doe")
+
+
 def test_get_profile_missing_returns_404(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("JOBSEARCH_HOME", str(tmp_path))
     app = _load_app()